@@ -20,4 +20,18 @@ name.
 A parameter set overrides the default help action of argparse with an action
 that displays not only the defined command line options and arguments, but also
 all accepted environment variables and configurataion file parameters.
+
+The Parameter, Argument, Option, and EnvVariable modules do not import argparse
+or configparser at module level, so parameter definitions can be imported
+cheaply.  Only the parameter_set module pulls in the parsers.  Applications
+that care about startup time should keep their parameter definitions as plain
+data and defer importing parameter_set and constructing the ParameterSet until
+the values are actually needed:
+
+    def main():
+        from parameters.parameter_set import ParameterSet
+
+        parameters = ParameterSet(description='...')
+        parameters.add_parameters(make_parameters())
+        values = parameters.collect_values()
 """
@@ -23,14 +23,26 @@ special meaning if specified:
                 value specified for the parameter.
 """
 
-from argparse import ArgumentParser, Namespace
-from typing import Any, Callable, Optional
+from sys import intern
+from typing import Any, Callable, Optional, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from argparse import ArgumentParser
+    from argparse import _ArgumentGroup, _MutuallyExclusiveGroup
 
 class Argument:
     """ Command Line Option/Argument Definition """
+    __slots__ = (
+        'long_name', 'use_prefix', 'kwargs', '_long_names', '_flags',
+        '_convert'
+    )
+
     long_name : str
     use_prefix : bool
     kwargs : dict[str, Any]
+    _long_names : dict[tuple[str, Optional[str]], str]
+    _flags : dict[tuple[str, Optional[str]], tuple[str, ...]]
+    _convert : bool
 
     def __init__(
         self,
@@ -53,18 +65,27 @@ class Argument:
                 the parameter group name.  Defaults to True (use the group
                 name prefix).
             kwargs:
-                Keyword arguments for ArgumentParser.add_argument().  A
-                shallow copy is saved.
+                Keyword arguments for ArgumentParser.add_argument().  The
+                keyword argument dictionary is freshly built for each call, so
+                it is saved as is.
         """
         self.long_name = long_name or None
         self.use_prefix = bool(use_prefix)
-        self.kwargs = kwargs.copy()
+        self.kwargs = kwargs
+        self._long_names = {}
+        self._flags = {}
+        self._convert = (
+            kwargs.get('type', None) is None and
+            kwargs.get('action', None) in (None, 'store')
+        )
 
     def add_argument(
         self,
         name : str,
         group : str,
-        parent : ArgumentParser,
+        parent : Union[
+            'ArgumentParser', '_ArgumentGroup', '_MutuallyExclusiveGroup'
+        ],
         converter : Optional[Callable[[str], Any]] = None
     ) -> None:
         """
@@ -79,7 +100,8 @@ class Argument:
                 argument name (with a '_' separator) to obtain the full long
                 name.  A None value disables the prefix.
             parent:
-                Argument parser to which the argument is added.
+                Argument parser, help group, or mutex group to which the
+                argument is added.
             converter:
                 A method that converts the original argument string value to
                 its desired type.  If the 'action' keyword argument is not
@@ -88,14 +110,30 @@ class Argument:
                 argument value.  Defaults to None (return the original string
                 value).
         """
-        long_name = self.get_long_name(name, group)
+        flags = self._flags.get((name, group), None)
+        if flags is None:
+            flags = self._flags[(name, group)] = self.get_flags(name, group)
 
-        type_converter = self.kwargs.get('type', None)
-        store_action = self.kwargs.get('action', None)
-        if type_converter is None and store_action in [None, 'store']:
+        if self._convert and converter is not None:
             self.kwargs['type'] = converter
 
-        parent.add_argument(long_name, **self.kwargs)
+        parent.add_argument(*flags, **self.kwargs)
+
+    def get_flags(self, name : str, group : str) -> tuple[str, ...]:
+        """
+        Construct the name or flags passed to add_argument()
+
+        Arguments:
+            name:
+                Parameter name.
+            group:
+                Group name.  May be None.
+
+        Returns:
+            The positional argument name.  add_argument() caches the result
+            by parameter name and group.
+        """
+        return (self.get_long_name(name, group),)
 
     def get_long_name(self, name : str, group : str) -> str:
         """
@@ -113,20 +151,27 @@ class Argument:
             specified parameter name, but this can be overridden with the
             long_name value.  If a group name is specified and the use_prefix
             value is True then the long name is prefixed with the group name.
+            The constructed name is interned and cached.
         """
-        parts = []
+        key = (name, group)
+        long_name = self._long_names.get(key, None)
+
+        if long_name is None:
+            long_name = self.long_name or name
+
+            if self.use_prefix and group:
+                long_name = f"{group}_{long_name}"
 
-        if self.use_prefix and group:
-            parts.append(group)
-        parts.append(self.long_name or name)
+            long_name = intern(long_name)
+            self._long_names[key] = long_name
 
-        return '_'.join(parts)
+        return long_name
 
     def get_value(
         self,
         name : str,
         group : str,
-        values : Namespace
+        values : dict[str, Any]
     ) -> Any:
         """
         Get argument value
@@ -137,14 +182,15 @@ class Argument:
             group:
                 Group name.  May be None.
             values:
-                Parsed argument values, accessed by constructed long name or
-                'dest' argument override.
+                Parsed argument values (the vars() of the argument parser
+                namespace), accessed by constructed long name or 'dest'
+                argument override.
 
         Returns:
             Parsed (and possible converted) argument value from the specified
-            argument parser namespace.
+            argument parser values.
         """
         override_name = self.kwargs.get('dest', None)
         long_name = override_name or self.get_long_name(name, group)
 
-        return getattr(values, long_name, None)
+        return values.get(long_name, None)
@@ -8,12 +8,16 @@ group name (with a '_' separator).
 """
 
 from os import environ
+from sys import intern
 from typing import Any, Callable, Optional
 
 class EnvVariable:
     """ Environment Variable Definition """
+    __slots__ = ('name', 'use_prefix', '_names')
+
     name : str
     use_prefix : bool
+    _names : dict[tuple[str, Optional[str]], str]
 
     def __init__(
         self,
@@ -37,6 +41,7 @@ class EnvVariable:
         """
         self.name = name
         self.use_prefix = bool(use_prefix)
+        self._names = {}
 
     def get_name(
         self,
@@ -58,21 +63,29 @@ class EnvVariable:
             uppercase version of the specified parameter name, but this can be
             overridden with the name value.  If a group name is specified and
             the use_prefix value is True then the environment variable name is
-            prefixed with the group name.
+            prefixed with the group name.  The constructed name is interned
+            and cached.
         """
-        parts = []
+        key = (name, group)
+        env_name = self._names.get(key, None)
+
+        if env_name is None:
+            env_name = self.name or name
 
-        if self.use_prefix and group:
-            parts.append(group)
-        parts.append(self.name or name)
+            if self.use_prefix and group:
+                env_name = f"{group}_{env_name}"
 
-        return '_'.join(parts).upper()
+            env_name = intern(env_name.upper())
+            self._names[key] = env_name
+
+        return env_name
 
     def get_value(
         self,
         name : str,
         group : str,
-        converter : Optional[Callable[[str], Any]] = None
+        converter : Optional[Callable[[str], Any]] = None,
+        environment : Optional[dict[str, str]] = None
     ) -> Any:
         """
         Get environment variable value
@@ -86,12 +99,19 @@ class EnvVariable:
                 Value converter.  Any found environment variable string value
                 will be passed to this method.  Defaults to None (return the
                 string value).
+            environment:
+                Environment variable values.  A snapshot (dict(os.environ))
+                avoids the key/value encoding overhead of os.environ when many
+                variables are fetched.  Defaults to None (use os.environ).
 
         Returns:
             Parsed (and possible converted) environment variable value.
         """
+        if environment is None:
+            environment = environ
+
         env_name = self.get_name(name, group)
-        value = environ.get(env_name, None)
+        value = environment.get(env_name, None)
 
         if value is not None and converter:
             value = converter(value)
@@ -0,0 +1,439 @@
+"""
+Fast Configuration File Parser
+
+Most configuration files only use the simple INI subset: section headers,
+'name = value' options, and '#' comments (full line or inline).  These are the
+same conventions as the ConfigParser built by make_config_parser.  The
+FastConfigParser class parses this subset with a pair of precompiled regular
+expressions, avoiding ConfigParser's per-line state machine.  It supports the
+subset of the ConfigParser interface that is used to read sources and fetch
+values (read, read_file, read_string, sections, items, has_option, and get),
+so it can be used in its place.
+
+Once a source that uses anything outside of this subset (indented or
+continuation lines, '$' interpolation syntax unless interpolation is disabled,
+options outside of a section, duplicate sections or options, or unrecognized
+lines) is read, all of the values read so far are handed off to a standard
+ConfigParser, which handles that and all later sources.  The results (and
+errors) are therefore the same as if ConfigParser had been used directly.
+"""
+
+import re
+from functools import lru_cache
+from pathlib import Path
+from sys import getdefaultencoding
+from typing import Any, Callable, ClassVar, Iterable, Optional, Union
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from configparser import ConfigParser
+
+def flatten_config(
+    config : Union['ConfigParser', 'FastConfigParser']
+) -> dict[Optional[str], dict[str, str]]:
+    """
+    Materialize all configuration values
+
+    Arguments:
+        config:
+            Parsed configuration file context.
+
+    Returns:
+        A dictionary of the (interpolated) option values for each section,
+        indexed by section name and then option name.  Section values include
+        the default section values.  The default section values are available
+        under both the default section name and None.
+    """
+    defaults = dict(config.items(config.default_section))
+
+    values = {
+        section: dict(config.items(section))
+        for section in config.sections()
+    }
+    values[config.default_section] = defaults
+    values[None] = defaults
+
+    return values
+
+class ConfigValues:
+    """ Lazily Interpolated Configuration Values """
+    __slots__ = ('config', 'values')
+
+    config : Optional[Union['ConfigParser', 'FastConfigParser']]
+    values : dict[tuple[Any, str], Optional[str]]
+
+    def __init__(
+        self,
+        config : Optional[Union['ConfigParser', 'FastConfigParser']] = None
+    ):
+        """
+        Wrap a configuration file parser
+
+        Arguments:
+            config:
+                Parsed configuration file context.  Defaults to None (no
+                configuration values).
+        """
+        self.config = config
+        self.values = {}
+
+    def get(self, section : Any, name : str) -> Optional[str]:
+        """
+        Get an (interpolated) option value
+
+        Only the options that are actually requested are interpolated, so
+        unrelated options with references that cannot be resolved do not cause
+        errors.  Each value is only interpolated once.
+
+        Arguments:
+            section:
+                Section name.  None for the default section.
+            name:
+                Option name.
+
+        Returns:
+            The option value from the section or the default section, or None
+            if the section or option does not exist.
+        """
+        key = (section, name)
+
+        try:
+            return self.values[key]
+        except KeyError:
+            pass
+
+        config = self.config
+        if config is None:
+            value = None
+        else:
+            value = config.get(
+                config.default_section if section is None else section,
+                name,
+                fallback=None
+            )
+
+        self.values[key] = value
+
+        return value
+
+def make_config_parser(interpolation : bool = True) -> 'ConfigParser':
+    """
+    Construct the configuration file parser
+
+    Arguments:
+        interpolation:
+            If True then extended interpolation is selected.  If False then
+            values are returned as is, without scanning them for '${...}'
+            references.  Defaults to True.
+
+    Returns:
+        The constructed configuration file parser.  The name/value delimiter is
+        set to '=' and the comment line character to '#'.  In line comments are
+        allowed.  Empty lines in values is disabled.
+    """
+    # pylint: disable=import-outside-toplevel
+    from configparser import ConfigParser, ExtendedInterpolation
+
+    return ConfigParser(
+        delimiters='=',
+        comment_prefixes='#',
+        inline_comment_prefixes='#',
+        empty_lines_in_values=False,
+        interpolation=ExtendedInterpolation() if interpolation else None
+    )
+
+# Parsed configuration text: (default section values, section values)
+ParsedText = tuple[dict[str, str], dict[str, dict[str, str]]]
+
+class FastConfigParser:
+    """ Regex-Based Configuration File Parser """
+    SECTION_RE : ClassVar[re.Pattern] = re.compile(
+        r'\[([^\]]+)\](?:\s+#.*)?\s*'
+    )
+    OPTION_RE : ClassVar[re.Pattern] = re.compile(
+        r'([^#=\s\[][^=]*?)\s*=\s*(.*?)(?:\s+#.*)?\s*'
+    )
+    ENCODING : ClassVar[str] = getdefaultencoding()
+
+    default_section : str
+    interpolation : bool
+    make_parser : Callable[[], 'ConfigParser']
+    defaults : dict[str, str]
+    options : dict[str, dict[str, str]]
+    parser : Optional['ConfigParser']
+
+    def __init__(
+        self,
+        default_section : Optional[str] = None,
+        make_parser : Optional[Callable[[], 'ConfigParser']] = None,
+        interpolation : bool = True
+    ):
+        """
+        Initialize the parser
+
+        Arguments:
+            default_section:
+                Name of the section whose values are inherited by all other
+                sections.  Defaults to None ('DEFAULT').
+            make_parser:
+                Constructs the ConfigParser that is used once a source that is
+                not in the supported subset is read.  Defaults to None (use
+                make_config_parser with the same interpolation setting).
+            interpolation:
+                If True then sources containing '$' are handed off to the
+                ConfigParser for extended interpolation.  If False then '$' has
+                no special meaning and such sources are parsed directly.
+                Defaults to True.
+        """
+        self.default_section = default_section or 'DEFAULT'
+        self.interpolation = interpolation
+        self.make_parser = make_parser or (
+            lambda: make_config_parser(interpolation)
+        )
+        self.defaults = {}
+        self.options = {}
+        self.parser = None
+
+    def read(self, path : Union[Path, str]) -> list[str]:
+        """
+        Read and parse a configuration file
+
+        Arguments:
+            path:
+                Input file to read.
+
+        Returns:
+            The list of files that were read (as for ConfigParser.read).
+        """
+        text = Path(path).read_text(encoding=self.ENCODING)
+        self.read_string(text, source=str(path))
+
+        return [str(path)]
+
+    def read_file(
+        self,
+        config : Iterable[str],
+        source : Optional[str] = None
+    ) -> None:
+        """
+        Read and parse an open configuration file
+
+        Arguments:
+            config:
+                Open text file (or other iterable of lines) to read.
+            source:
+                Source name for error messages.  Defaults to None (the file
+                name, if any, or '<???>').
+        """
+        if source is None:
+            source = getattr(config, 'name', '<???>')
+
+        self.read_string(''.join(config), source=source)
+
+    def read_string(
+        self,
+        text : str,
+        source : Optional[str] = None
+    ) -> None:
+        """
+        Parse configuration text
+
+        Values from later sources override values from earlier sources.  Once
+        a source outside of the supported subset is read, all of the values
+        are handed off to a ConfigParser, which handles all later sources.
+
+        Arguments:
+            text:
+                Configuration text to parse.
+            source:
+                Source name for error messages.  Defaults to None ('<string>').
+        """
+        parsed = None if self.parser else self.parse(text)
+
+        if parsed is None:
+            if not self.parser:
+                self.parser = self.make_parser()
+                self.parser.read_dict(
+                    {self.default_section: self.defaults, **self.options}
+                )
+            self.parser.read_string(text, source=source or '<string>')
+            return
+
+        defaults, options = parsed
+        self.defaults.update(defaults)
+        for section, values in options.items():
+            self.options.setdefault(section, {}).update(values)
+
+    def parse(self, text : str) -> Optional[ParsedText]:
+        """
+        Parse configuration text in the supported subset
+
+        The results are shared by all parsers in the process, so the same
+        text (for example, the same configuration file read by several
+        parameter sets) is only scanned once.  Only the most recently parsed
+        texts are kept (see scan).
+
+        Arguments:
+            text:
+                Configuration text to parse.
+
+        Returns:
+            The default section values and the other section values indexed
+            by section name, or None if the text is not in the supported
+            subset.  Option names are converted to lowercase, as ConfigParser
+            does by default.  The returned dictionaries are shared and must not
+            be modified.
+        """
+        return self.scan(text, self.default_section, self.interpolation)
+
+    @classmethod
+    @lru_cache(maxsize=16)
+    def scan(
+        cls,
+        text : str,
+        default_section : str,
+        interpolation : bool
+    ) -> Optional[ParsedText]:
+        """
+        Scan configuration text in the supported subset (cached)
+
+        Arguments:
+            text:
+                Configuration text to scan.
+            default_section:
+                Name of the default section.
+            interpolation:
+                If True then text containing '$' is not supported.
+
+        Returns:
+            The parsed text (see parse), or None if the text is not in the
+            supported subset.
+        """
+        if interpolation and '$' in text:
+            return None
+
+        defaults = {}
+        sections = {}
+        options = None
+        seen = set()
+
+        for line in text.split('\n'):
+            if not line or line.isspace() or line[0] == '#':
+                continue
+
+            match = cls.OPTION_RE.fullmatch(line)
+            if match:
+                name = match[1].lower()
+                if options is None or name in options:
+                    return None
+                options[name] = match[2]
+                continue
+
+            match = cls.SECTION_RE.fullmatch(line)
+            if not match:
+                return None
+
+            section = match[1]
+            if section in seen:
+                return None
+            seen.add(section)
+
+            if section == default_section:
+                options = defaults
+            else:
+                options = sections[section] = {}
+
+        return defaults, sections
+
+    def sections(self) -> list[str]:
+        """
+        Get the section names
+
+        Returns:
+            The names of the sections that have been read, excluding the
+            default section.
+        """
+        if self.parser:
+            return self.parser.sections()
+
+        return list(self.options)
+
+    def items(self, section : str) -> list[tuple[str, str]]:
+        """
+        Get the values of a section
+
+        Arguments:
+            section:
+                Section name.  May be the default section.
+
+        Returns:
+            The (name, value) pairs of the section, including the default
+            section values.
+        """
+        if self.parser:
+            return self.parser.items(section)
+
+        if section == self.default_section:
+            return list(self.defaults.items())
+
+        return list({**self.defaults, **self.options[section]}.items())
+
+    def has_option(self, section : Optional[str], option : str) -> bool:
+        """
+        Check for an option
+
+        Arguments:
+            section:
+                Section name.  None or the default section name for the
+                default section.
+            option:
+                Option name.
+
+        Returns:
+            True if the option exists in the section or the default section.
+        """
+        if self.parser:
+            return self.parser.has_option(section, option)
+
+        option = option.lower()
+
+        if not section or section == self.default_section:
+            return option in self.defaults
+
+        if section not in self.options:
+            return False
+
+        return option in self.options[section] or option in self.defaults
+
+    def get(
+        self,
+        section : str,
+        option : str,
+        *,
+        fallback : Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Get an option value
+
+        Arguments:
+            section:
+                Section name.  May be the default section.
+            option:
+                Option name.
+            fallback:
+                Value returned if the section or option does not exist.
+                Defaults to None.
+
+        Returns:
+            The option value from the section or the default section.
+        """
+        if self.parser:
+            return self.parser.get(section, option, fallback=fallback)
+
+        if not self.has_option(section, option):
+            return fallback
+
+        option = option.lower()
+        values = self.options.get(section, {})
+
+        return values.get(option, self.defaults.get(option, None))
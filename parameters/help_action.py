@@ -7,19 +7,23 @@ of recognized environment variables and configuration file parameters.
 
 from argparse import Action, ArgumentParser, SUPPRESS
 import sys
-from typing import Any, ClassVar, Iterable
+from typing import Any, ClassVar, Iterable, Optional
 
-from parameters.parameter import Parameter
+# An extended help row: (environment variable or parameter name, help text)
+HelpRow = tuple[str, Optional[str]]
+
+_ROW = '  {:<{}s} {}'.format
 
 class HelpAction(Action):
     """ Extended Help Action """
     HELP : ClassVar[str] = 'show this help message and exit'
+    NAME_WIDTH : ClassVar[int] = 21
 
     def __init__(
         self,
         option_strings : list[str],
         *_args : list[Any],
-        const : Iterable[Parameter],
+        const : tuple[dict[str, HelpRow], dict[str, HelpRow]],
         **_kwargs : dict[str, Any]
     ):
         """
@@ -32,8 +36,10 @@ class HelpAction(Action):
                 Positional arguments for the Action base class (unused).
                 are ignored.
             const:
-                List of parameters from which the environment variable and
-                configuration file parameter information is gleaned.
+                The environment variable and configuration file parameter help
+                rows, each a (name, help text) pair indexed by full parameter
+                name.  The rows are maintained by the owner as parameters are
+                added.
             kwargs:
                 Keyword arguments for Action base class (unused).
         """
@@ -46,6 +52,29 @@ class HelpAction(Action):
             help=self.HELP
         )
 
+    @classmethod
+    def format_rows(cls, rows : Iterable[HelpRow]) -> str:
+        """
+        Format environment variable or configuration parameter help lines
+
+        Arguments:
+            rows:
+                The (name, help text) pairs to format.  The help text may be
+                None.
+
+        Returns:
+            The formatted help lines.  The names are left justified in a
+            column that is wide enough for the longest name, but no narrower
+            than the standard argparse option column.
+        """
+        rows = list(rows)
+        width = max((len(name) for name, _ in rows), default=0)
+        width = max(width, cls.NAME_WIDTH)
+
+        return '\n'.join(
+            _ROW(name, width, help_text or '') for name, help_text in rows
+        )
+
     def __call__(
         self,
         parser : ArgumentParser,
@@ -63,32 +92,16 @@ class HelpAction(Action):
             kwargs:
                 Other keyword arguments (unused).
         """
-        env_help = []
-        config_help = []
-
-        parameters : Iterable[Parameter] = self.const
-
-        for parameter in parameters:
-            help_text = parameter.help_text or ''
-
-            if parameter.env:
-                env_name = parameter.env.get_name(
-                    parameter.name, parameter.group
-                )
-                env_help.append(f"  {env_name:<21s} {help_text:<s}")
-
-            if parameter.config:
-                config_name = parameter.get_full_name()
-                config_help.append(f"  {config_name:<21s} {help_text:<s}")
+        env_help, config_help = self.const
 
         parser.print_help()
 
         if env_help:
             print('\nenvironment variables:')
-            print('\n'.join(env_help))
+            print(self.format_rows(env_help.values()))
 
         if config_help:
             print('\nconfiguration parameters:')
-            print('\n'.join(config_help))
+            print(self.format_rows(config_help.values()))
 
         sys.exit(0)
@@ -23,13 +23,14 @@ special meaning if specified:
                 value specified for the parameter.
 """
 
-from argparse import ArgumentParser, _ArgumentGroup, _MutuallyExclusiveGroup
-from typing import Any, Callable, Optional, Union
+from typing import Any, Optional
 
 from parameters.argument import Argument
 
 class Option(Argument):
     """ Command Line Option """
+    __slots__ = ('short_name', 'short_prefix', 'help_or_mutex')
+
     short_name : str
     short_prefix : str
     help_or_mutex : str
@@ -63,49 +64,31 @@ class Option(Argument):
         self.short_prefix = short_prefix
         self.help_or_mutex = help_or_mutex
 
-    def add_argument(
-        self,
-        name : str,
-        group : str,
-        parent : Union[ArgumentParser, _ArgumentGroup, _MutuallyExclusiveGroup],
-        converter : Optional[Callable[[str], Any]] = None
-    ) -> None:
+    def get_flags(self, name : str, group : str) -> tuple[str, ...]:
         """
-        Add an argument
+        Construct the option flags passed to add_argument()
 
         Arguments:
             name:
                 Parameter name.  This name is normally used as the long
-                argument name.
+                option name.
             group:
                 Group name.  This name is optionally prefixed to the long
-                argument name (with a '_' separator) to obtain the full long
+                option name (with a '_' separator) to obtain the full long
                 name.  A None value disables the prefix.
-            parent:
-                Argument parser, help group, or mutex group to which the
-                argument is added.
-            converter:
-                A method that converts the original argument string value to
-                its desired type.  If the 'action' keyword argument is not
-                specified or is 'store' and the 'type' keyword argument is not
-                specified then this converter is used as the 'type' keyword
-                argument value.  Defaults to None (return the original string
-                value).
+
+        Returns:
+            The short option name (if any) and the long option name, with
+            their '-' and '--' prefixes.  add_argument() caches the result by
+            parameter name and group.
         """
-        long_name = self.get_long_name(name, group)
+        long_name = '--' + self.get_long_name(name, group)
         short_name = self.get_short_name()
 
-        names = []
         if short_name:
-            names.append('-' + short_name)
-        names.append('--' + long_name)
-
-        type_converter = self.kwargs.get('type', None)
-        store_action = self.kwargs.get('action', None)
-        if type_converter is None and store_action in [None, 'store']:
-            self.kwargs['type'] = converter
+            return ('-' + short_name, long_name)
 
-        parent.add_argument(*names, **self.kwargs)
+        return (long_name,)
 
     def get_short_name(self) -> str:
         """
@@ -28,27 +28,42 @@ follows:
                         fetched is assumed.
 """
 
-from argparse import ArgumentParser, Namespace
-from argparse import _ArgumentGroup, _MutuallyExclusiveGroup
-from configparser import ConfigParser
-from typing import Any, Callable, Optional, Union
+from os import environ
+from sys import intern
+from typing import Any, Callable, Optional, Union, TYPE_CHECKING
 
 from parameters.argument import Argument
 from parameters.option import Option
 from parameters.env_variable import EnvVariable
 
+if TYPE_CHECKING:
+    from argparse import ArgumentParser
+    from argparse import _ArgumentGroup, _MutuallyExclusiveGroup
+    from parameters.fast_config import ConfigValues
+
+# A value source: (arguments, configuration, environment) -> value or None
+Source = Callable[[dict[str, Any], 'ConfigValues', Optional[dict]], Any]
+
 class Parameter:
     """ Application Parameter Definition """
     # pylint: disable=too-many-instance-attributes
+    __slots__ = (
+        'name', 'group', 'full_name', 'arg', 'help_or_mutex', 'env',
+        'env_name', 'config', 'converter', 'default', 'help_text', 'resolver'
+    )
 
     name : str
     group : str
+    full_name : str
     arg : Union[Argument, Option]
+    help_or_mutex : Optional[str]
     env : EnvVariable
+    env_name : str
     config : bool
     converter : Callable[[str], Any]
     default : Any
     help_text : str
+    resolver : Source
 
     def __init__(
         # pylint: disable=too-many-arguments
@@ -104,8 +119,13 @@ class Parameter:
         """
         self.name = name
         self.group = group
+        self.full_name = intern(self.get_full_name())
         self.arg = arg
+        self.help_or_mutex = (
+            arg.help_or_mutex if isinstance(arg, Option) else None
+        )
         self.env = env
+        self.env_name = env.get_name(name, group) if env else None
         self.config = config if isinstance(config, Parameter) else bool(config)
         self.converter = converter
 
@@ -126,25 +146,26 @@ class Parameter:
             self.arg.kwargs['help'] = help_text
         self.help_text = help_text
 
+        self.resolver = self.make_resolver()
+
     def get_full_name(self) -> str:
         """
         Construct parameter full name
 
         Returns:
             The parameter name possibly prefixed with the group name and a
-            '_' separator.
+            '_' separator.  This value is also saved as the full_name.
         """
-        parts = []
-
         if self.group:
-            parts.append(self.group)
-        parts.append(self.name)
+            return f"{self.group}_{self.name}"
 
-        return '_'.join(parts)
+        return self.name
 
     def add_argument(
         self,
-        parent : Union[ArgumentParser, _ArgumentGroup, _MutuallyExclusiveGroup]
+        parent : Union[
+            'ArgumentParser', '_ArgumentGroup', '_MutuallyExclusiveGroup'
+        ]
     ) -> None:
         """
         Add parameter argument to parent
@@ -164,17 +185,22 @@ class Parameter:
 
     def get_value(
         self,
-        values : Namespace,
-        config : ConfigParser
+        values : dict[str, Any],
+        config : 'ConfigValues',
+        environment : Optional[dict[str, str]] = None
     ) -> Any:
         """
         Get parameter value according to source precedence
 
         Arguments:
-            parser:
-                Parsed command line argument values.
+            values:
+                Parsed command line argument values (the vars() of the
+                argument parser namespace).
             config:
-                Parsed configuration file context.
+                Parsed configuration values (see fast_config.ConfigValues).
+            environment:
+                Environment variable values.  Defaults to None (use
+                os.environ).
 
         Returns:
             Value from the command line, an environment variable, a
@@ -182,32 +208,121 @@ class Parameter:
             precendence.  Note that if there is not group then configuration
             values are taken from the current default section.
         """
-        if self.arg:
-            value = self.arg.get_value(self.name, self.group, values)
-            if value is not None:
-                return value
+        return self.resolver(values, config, environment)
 
-        if self.env:
-            value = self.env.get_value(
-                self.name, self.group, converter=self.converter
-            )
-            if value is not None:
-                return value
+    def make_resolver(self) -> Source:
+        """
+        Construct the value resolver
+
+        The sources of a parameter value are fixed when the parameter is
+        defined, so the resolver only consults the sources that actually
+        exist, in order of precedence, without rechecking which sources are
+        present on each call.
 
+        Returns:
+            A callable with the same arguments as get_value that returns the
+            resolved parameter value.
+        """
+        sources = []
+        if self.arg:
+            sources.append(self.make_arg_source())
+        if self.env:
+            sources.append(self.make_env_source())
         if self.config:
-            if isinstance(self.config, Parameter):
-                group = self.config.get_value(values, config)
-            elif self.group:
-                group = self.group
-            else:
-                group = config.default_section
+            sources.append(self.make_config_source())
+
+        default = self.default
+
+        if not sources:
+            def resolve(_values, _config, _environment):
+                return default
+        elif len(sources) == 1:
+            source = sources[0]
+
+            def resolve(values, config, environment):
+                value = source(values, config, environment)
+                return default if value is None else value
+        else:
+            def resolve(values, config, environment):
+                for source in sources:
+                    value = source(values, config, environment)
+                    if value is not None:
+                        return value
+                return default
+
+        return resolve
 
-            value = config.get(group, self.name, fallback=None)
+    def make_arg_source(self) -> Source:
+        """
+        Construct the command line value source
 
-            if value is not None and self.converter:
-                value = self.converter(value)
+        Returns:
+            A source that returns the parsed argument value, accessed by the
+            constructed long name or 'dest' argument override.
+        """
+        key = self.arg.kwargs.get('dest', None)
+        key = key or self.arg.get_long_name(self.name, self.group)
 
-            if value is not None:
-                return value
+        def source(values, _config, _environment):
+            return values.get(key, None)
+
+        return source
+
+    def make_env_source(self) -> Source:
+        """
+        Construct the environment variable value source
+
+        Returns:
+            A source that returns the (converted) environment variable value.
+        """
+        key = self.env_name
+        converter = self.converter
+
+        if converter:
+            def source(_values, _config, environment):
+                if environment is None:
+                    environment = environ
+                value = environment.get(key, None)
+                return None if value is None else converter(value)
+        else:
+            def source(_values, _config, environment):
+                if environment is None:
+                    environment = environ
+                return environment.get(key, None)
+
+        return source
+
+    def make_config_source(self) -> Source:
+        """
+        Construct the configuration file value source
+
+        Returns:
+            A source that returns the (converted) configuration value.  The
+            section is the group name, the value of the alternate section
+            parameter, or the default section if there is no group.  There is
+            no value if the alternate section parameter has no value.  The
+            option name is converted to lowercase, as ConfigParser does.
+        """
+        name = self.name.lower()
+        converter = self.converter
+
+        if isinstance(self.config, Parameter):
+            section = self.config
+
+            def get_config(values, config, environment):
+                group = section.get_value(values, config, environment)
+                return None if group is None else config.get(group, name)
+        else:
+            group = self.group
+
+            def get_config(_values, config, _environment):
+                return config.get(group, name)
+
+        if converter:
+            def source(values, config, environment):
+                value = get_config(values, config, environment)
+                return None if value is None else converter(value)
+        else:
+            source = get_config
 
-        return self.default
+        return source
@@ -9,44 +9,112 @@ final set of values is returned via a dictionary that is indexed by parameter
 name.
 """
 
-from argparse import ArgumentParser, Namespace, SUPPRESS
+from argparse import ArgumentParser, SUPPRESS
 from argparse import _ArgumentGroup, _MutuallyExclusiveGroup
-from configparser import ConfigParser, ExtendedInterpolation
+from configparser import ConfigParser
+from os import environ, getcwd, stat, stat_result
+from os.path import expanduser, realpath
 from pathlib import Path
+import sys
 from sys import getdefaultencoding
-from typing import Any, Iterable, Optional, Union
+from types import MappingProxyType
+from typing import Any, Callable, ClassVar, Iterable, Mapping, Optional
+from typing import Union
 
-from parameters.help_action import HelpAction
-from parameters.option import Option
-from parameters.parameter import Parameter
+from parameters.fast_config import ConfigValues, FastConfigParser
+from parameters.fast_config import make_config_parser
+from parameters.help_action import HelpAction, HelpRow
+from parameters.parameter import Parameter, Source
 
-from utility.expand_path import expand_path
+# A configuration source reader: (self, source, arguments, environment)
+SourceReader = Callable[
+    ['ParameterSet', Any, dict[str, Any], Optional[dict[str, str]]], None
+]
 
 class ParameterSet:
     """ Application Parameter Set Definition """
+    __slots__ = (
+        'parameters', 'resolvers', 'env_help', 'config_help', 'groups',
+        'arguments', 'help_action', '_config', '_config_settings',
+        '_sources_read', '_last_collection', '_empty_values'
+    )
+
+    HELP_OPTIONS : ClassVar[tuple[str, ...]] = ('-h', '--help')
+    PARSER_KWARGS : ClassVar[Mapping[str, Any]] = MappingProxyType(
+        {'add_help': False}
+    )
+    SOURCE_CACHE : ClassVar[dict[Path, tuple[int, int, str]]] = {}
+    ENCODING : ClassVar[str] = getdefaultencoding()
+
     parameters : dict[str, Parameter]
+    resolvers : list[tuple[str, Source]]
+    env_help : dict[str, HelpRow]
+    config_help : dict[str, HelpRow]
     groups : dict[str, Union[_ArgumentGroup, _MutuallyExclusiveGroup]]
     arguments : ArgumentParser
-    config : ConfigParser
+    help_action : HelpAction
+    _config : Optional[Union[ConfigParser, FastConfigParser]]
+    _config_settings : tuple[bool, bool]
+    _sources_read : list[tuple[str, tuple[int, int, int]]]
+    _last_collection : Optional[tuple[tuple, tuple, ConfigValues]]
+    _empty_values : Optional[tuple[tuple, Union[bool, dict[str, Any]]]]
 
     def __init__(
         self,
+        fast : bool = False,
+        interpolation : bool = True,
         **kwargs : dict[str, Any]
     ):
         """
         Create a new parameter set
 
         Arguments:
+            fast:
+                If True then configuration sources are read with the
+                regex-based FastConfigParser, which hands off to ConfigParser
+                for sources that it does not support.  Defaults to False (use
+                ConfigParser).
+            interpolation:
+                If True then configuration values may use extended
+                interpolation ('${section:name}' references).  Applications
+                that do not use references can disable it so that values are
+                not scanned for them.  Defaults to True.
             kwargs:
                 Keyword arguments for ArgumentParser().
         """
         self.parameters = {}
+        self.resolvers = []
+        self.env_help = {}
+        self.config_help = {}
         self.groups = {}
 
         self.arguments = self.make_argument_parser(**kwargs)
         self.setup_help()
 
-        self.config = self.make_config_parser()
+        self._config = None
+        self._config_settings = (fast, interpolation)
+        self._sources_read = []
+        self._last_collection = None
+        self._empty_values = None
+
+    @property
+    def config(self) -> Union[ConfigParser, FastConfigParser]:
+        """
+        Get the configuration file parser
+
+        Returns:
+            The configuration file parser.  The parser is not constructed
+            until it is first needed, so applications that never supply a
+            configuration source do not pay for it.  Since the caller may read
+            more configuration data, the next collection does not reuse the
+            previous configuration values.
+        """
+        self._last_collection = None
+
+        if self._config is None:
+            self._config = self.make_config_parser(*self._config_settings)
+
+        return self._config
 
     def add_help_group(
         self,
@@ -98,20 +166,53 @@ class ParameterSet:
             parameters:
                 One or more parameters to add to the parameter set.
         """
+        self._last_collection = None
+
         if isinstance(parameters, Parameter):
-            parameters = [parameters]
+            parameters = (parameters,)
+
+        groups = self.groups
+        arguments = self.arguments
+        store = self.parameters
+        resolvers = self.resolvers
+
+        for parameter in parameters or ():
+            name = parameter.full_name
+
+            parent = groups.get(parameter.help_or_mutex, None)
+            parameter.add_argument(parent or arguments)
 
-        for parameter in parameters or []:
-            name = parameter.get_full_name()
+            if name in store:
+                store[name] = parameter
+                resolvers[:] = [
+                    (key, value.resolver) for key, value in store.items()
+                ]
+            else:
+                store[name] = parameter
+                resolvers.append((name, parameter.resolver))
 
-            parent = None
-            if isinstance(parameter.arg, Option):
-                parent = self.groups.get(parameter.arg.help_or_mutex, None)
-            parent = parent or self.arguments
+            self.add_help(parameter)
 
-            parameter.add_argument(parent)
+    def add_help(self, parameter : Parameter) -> None:
+        """
+        Add the extended help rows for a parameter
+
+        Arguments:
+            parameter:
+                Parameter whose environment variable and configuration file
+                parameter help rows are recorded for the help action.
+        """
+        name = parameter.full_name
 
-            self.parameters[name] = parameter
+        if parameter.env:
+            self.env_help[name] = (parameter.env_name, parameter.help_text)
+        else:
+            self.env_help.pop(name, None)
+
+        if parameter.config:
+            self.config_help[name] = (name, parameter.help_text)
+        else:
+            self.config_help.pop(name, None)
 
     def collect_values(
         self,
@@ -133,20 +234,156 @@ class ParameterSet:
 
         Returns:
             A dictionary of the found parameter values indexed by full
-            parameter name
+            parameter name.  The values are resolved afresh on each call, but
+            if the command line arguments, the environment, the configuration
+            source, and any configuration files that were read are all
+            unchanged since the previous call (and the working directory and
+            the configuration parser have not changed either) then the
+            configuration values of the previous call are reused without
+            rereading the source.
         """
-        values = {}
+        args = sys.argv[1:] if args is None else args
+        self.check_help(args)
+
+        environment = dict(environ)
+        key = (tuple(args), environment, config, getcwd())
+        arguments = self.parse_arguments(args)
+
+        last = self._last_collection
+        if last and last[0] == key and self.sources_unchanged(last[1]):
+            config_values = last[2]
+        else:
+            self._sources_read = []
+            self.read_source(config, arguments, environment)
+            config_values = self.get_config_values()
+
+            stamps = tuple(self._sources_read)
+            self._last_collection = (key, stamps, config_values)
+
+        return {
+            name: resolver(arguments, config_values, environment)
+            for name, resolver in self.resolvers
+        }
+
+    def parse_arguments(self, args : list[str]) -> dict[str, Any]:
+        """
+        Parse the command line arguments
 
-        arguments = self.arguments.parse_args(args)
-        self.read_source(config, arguments)
+        Arguments:
+            args:
+                Command line arguments.
 
-        for name, parameter in self.parameters.items():
-            values[name] = parameter.get_value(arguments, self.config)
+        Returns:
+            The parsed argument values (the vars() of the argument parser
+            namespace).  An empty argument list is not parsed if the default
+            values can be determined directly (see get_empty_values).  The
+            default values are determined again if the argument parser has
+            changed since they were last determined.
+        """
+        if not args:
+            signature = self.get_parser_signature()
+            empty = self._empty_values
+            if empty is None or empty[0] != signature:
+                empty = self._empty_values = (
+                    signature, self.get_empty_values()
+                )
+            if empty[1] is not False:
+                return empty[1]
+
+        return vars(self.arguments.parse_args(args))
+
+    def get_parser_signature(self) -> tuple:
+        """
+        Summarize the argument parser state
+
+        Returns:
+            The numbers of actions and mutex groups and a copy of the parser
+            level defaults.  These change whenever arguments, groups, or
+            defaults are added to the parser, whether or not through this
+            parameter set.
+        """
+        # pylint: disable=protected-access
+        parser = self.arguments
+
+        return (
+            len(parser._actions),
+            len(parser._mutually_exclusive_groups),
+            dict(parser._defaults)
+        )
+
+    def get_empty_values(self) -> Union[bool, dict[str, Any]]:
+        """
+        Determine the parsed values of an empty command line
+
+        Returns:
+            The argument default values indexed by destination, exactly as
+            parse_args would return them for an empty argument list.  False if
+            the parser must be run: there are positional or required arguments,
+            required mutex groups, or string defaults that parse_args would
+            convert.
+        """
+        # pylint: disable=protected-access
+        parser = self.arguments
+
+        if any(group.required for group in parser._mutually_exclusive_groups):
+            return False
+
+        values = {}
+        for action in parser._actions:
+            if action.required or not action.option_strings:
+                return False
+            if action.dest is SUPPRESS or action.default is SUPPRESS:
+                continue
+            if isinstance(action.default, str):
+                return False
+            values.setdefault(action.dest, action.default)
+
+        for dest, value in parser._defaults.items():
+            values.setdefault(dest, value)
 
         return values
 
     @staticmethod
+    def sources_unchanged(stamps : Iterable[tuple[str, tuple]]) -> bool:
+        """
+        Check whether configuration files have changed
+
+        Arguments:
+            stamps:
+                The (file name, stamp) pairs of the files to check (see
+                get_stamp).
+
+        Returns:
+            True if all of the files still exist with the same stamps.
+        """
+        for filename, stamp in stamps:
+            try:
+                status = stat(filename)
+            except OSError:
+                return False
+            if ParameterSet.get_stamp(status) != stamp:
+                return False
+
+        return True
+
+    @staticmethod
+    def get_stamp(status : stat_result) -> tuple[int, int, int]:
+        """
+        Get the change stamp of a file
+
+        Arguments:
+            status:
+                File status.
+
+        Returns:
+            The (inode, modification time, size) of the file.  The inode
+            changes if a symbolic link is switched to another file.
+        """
+        return (status.st_ino, status.st_mtime_ns, status.st_size)
+
+    @classmethod
     def make_argument_parser(
+        cls,
         **kwargs : dict[str, Any]
     ) -> ArgumentParser:
         """
@@ -154,54 +391,83 @@ class ParameterSet:
 
         Arguments:
             kwargs:
-                Keyword arguments for ArgumentParser().  The add_help argument
-                is forced to False since an extended help action will be added.
-                If a help formatter is not specified then the one that adds
-                default information is specified.
+                Keyword arguments for ArgumentParser().  The PARSER_KWARGS
+                values override any caller values.  In particular, add_help is
+                forced to False since an extended help action will be added.
+                The keyword argument dictionary is freshly built for each
+                call, so it is updated in place.
 
         Returns:
             The constructed command line argument parser.
         """
-        kwargs = kwargs.copy()
-        kwargs['add_help'] = False
-
+        kwargs.update(cls.PARSER_KWARGS)
         return ArgumentParser(**kwargs)
 
     def setup_help(self) -> None:
         """ Setup extended help """
         self.arguments.register('action', 'help', HelpAction)
 
-        self.arguments.add_argument(
-            '-h', '--help',
+        self.help_action = self.arguments.add_argument(
+            *self.HELP_OPTIONS,
             action='help',
-            const=self.parameters,
+            const=(self.env_help, self.config_help),
             dest=SUPPRESS,
             default=SUPPRESS
         )
 
+    def check_help(self, args : list[str]) -> None:
+        """
+        Show help without a full parse if that is all that was requested
+
+        Arguments:
+            args:
+                Command line arguments.  If the only argument is one of the
+                help options then the help information is displayed directly
+                and the application exits, bypassing the argument parser.
+        """
+        if len(args) == 1 and args[0] in self.HELP_OPTIONS:
+            self.help_action(self.arguments)
+
     @staticmethod
-    def make_config_parser() -> ConfigParser:
+    def make_config_parser(
+        fast : bool = False,
+        interpolation : bool = True
+    ) -> Union[ConfigParser, FastConfigParser]:
         """
         Construct the configuration file parser
 
+        Arguments:
+            fast:
+                If True then construct a FastConfigParser.  Defaults to False.
+            interpolation:
+                If True then extended interpolation is selected.  Defaults to
+                True.
+
         Returns:
-            The constructed configuration file parser.  Extended interpolation
-            is selected.  The name/value delimiter is set to '=' and the
-            comment line character to '#'.  In line comments are allowed.
-            Empty lines in values is disabled.
-        """
-        return ConfigParser(
-            delimiters='=',
-            comment_prefixes='#',
-            inline_comment_prefixes='#',
-            empty_lines_in_values=False,
-            interpolation=ExtendedInterpolation()
-        )
+            The constructed configuration file parser (see
+            fast_config.make_config_parser).
+        """
+        if fast:
+            return FastConfigParser(interpolation=interpolation)
+
+        return make_config_parser(interpolation)
+
+    def get_config_values(self) -> ConfigValues:
+        """
+        Get the configuration values read so far
+
+        Returns:
+            The configuration values, which are only interpolated as they are
+            looked up.  There are no values if the configuration file parser
+            has not been constructed yet.
+        """
+        return ConfigValues(self._config)
 
     def read_source(
         self,
         config : Union[Path, Parameter, str],
-        arguments : Namespace
+        arguments : dict[str, Any],
+        environment : Optional[dict[str, str]] = None
     ) -> None:
         """
         Read and parse configuration data from source
@@ -212,15 +478,104 @@ class ParameterSet:
             arguments:
                 Parsed command line argument values.  Used when the
                 configuration file name is specified by another parameter.
+            environment:
+                Environment variable values.  Used when the configuration
+                file name is specified by another parameter.  Defaults to None
+                (use os.environ).
+        """
+        reader = self.get_source_reader(type(config))
+        if reader:
+            reader(self, config, arguments, environment)
+
+    @classmethod
+    def get_source_reader(cls, source_type : type) -> Optional[SourceReader]:
+        """
+        Get the reader for a configuration source type
+
+        Arguments:
+            source_type:
+                Type of the configuration source.
+
+        Returns:
+            The SOURCE_READERS method for the source type or its nearest
+            registered base type, or None if the source type is not supported.
+            Subclass lookups are added to SOURCE_READERS so that they are only
+            resolved once.
         """
-        if isinstance(config, Parameter):
-            filename = config.get_value(arguments, self.config)
-            if filename:
-                self.read_source_file(filename)
-        elif isinstance(config, Path):
-            self.read_source_file(config)
-        elif isinstance(config, str):
-            self.config.read_string(config)
+        readers = cls.SOURCE_READERS
+
+        if source_type not in readers:
+            readers[source_type] = next(
+                (
+                    reader for base_type, reader in list(readers.items())
+                    if reader and issubclass(source_type, base_type)
+                ),
+                None
+            )
+
+        return readers[source_type]
+
+    def read_parameter_source(
+        self,
+        config : Parameter,
+        arguments : dict[str, Any],
+        environment : Optional[dict[str, str]]
+    ) -> None:
+        """
+        Read the configuration file named by another parameter
+
+        Arguments:
+            config:
+                Parameter whose value is the configuration file name.  Nothing
+                is read if there is no value.
+            arguments:
+                Parsed command line argument values.
+            environment:
+                Environment variable values.  May be None (use os.environ).
+        """
+        filename = config.get_value(
+            arguments, self.get_config_values(), environment
+        )
+        if filename:
+            self.read_source_file(filename)
+
+    def read_path_source(
+        self,
+        config : Path,
+        _arguments : dict[str, Any],
+        _environment : Optional[dict[str, str]]
+    ) -> None:
+        """
+        Read a configuration file
+
+        Arguments:
+            config:
+                Configuration file to read.
+            arguments:
+                Parsed command line argument values (unused).
+            environment:
+                Environment variable values (unused).
+        """
+        self.read_source_file(config)
+
+    def read_string_source(
+        self,
+        config : str,
+        _arguments : dict[str, Any],
+        _environment : Optional[dict[str, str]]
+    ) -> None:
+        """
+        Read configuration text
+
+        Arguments:
+            config:
+                Configuration text to parse.
+            arguments:
+                Parsed command line argument values (unused).
+            environment:
+                Environment variable values (unused).
+        """
+        self.config.read_string(config)
 
     def read_source_file(self, path : Path) -> None:
         """
@@ -230,6 +585,45 @@ class ParameterSet:
             path:
                 Input file to read.
         """
-        filename = expand_path(path)
-        with open(filename, encoding=getdefaultencoding()) as config:
-            self.config.read_file(config, source=str(filename))
+        # Links are resolved on every read, since they may be switched
+        source = expanduser(path)
+        status = stat(source)
+        filename = Path(realpath(source))
+
+        self.config.read_string(
+            self.read_source_text(filename), source=str(filename)
+        )
+        self._sources_read.append((source, self.get_stamp(status)))
+
+    @classmethod
+    def read_source_text(cls, filename : Path) -> str:
+        """
+        Read a configuration file
+
+        Arguments:
+            filename:
+                Expanded input file name.
+
+        Returns:
+            The configuration file text.  The text is cached by file name and
+            is only reread if the file modification time or size changes.
+        """
+        status = stat(filename)
+        cached = cls.SOURCE_CACHE.get(filename, None)
+
+        if cached and cached[:2] == (status.st_mtime_ns, status.st_size):
+            return cached[2]
+
+        text = filename.read_text(encoding=cls.ENCODING)
+
+        cls.SOURCE_CACHE[filename] = (
+            status.st_mtime_ns, status.st_size, text
+        )
+
+        return text
+
+    SOURCE_READERS : ClassVar[dict[type, Optional[SourceReader]]] = {
+        Parameter: read_parameter_source,
+        Path: read_path_source,
+        str: read_string_source,
+    }
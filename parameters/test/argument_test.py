@@ -5,14 +5,21 @@ Argument/Option Test Base Class
 import unittest
 
 from argparse import ArgumentParser, Namespace
+from types import MappingProxyType
+from typing import Any, ClassVar, Mapping
 
 class ArgumentTest(unittest.TestCase):
     """ Argument/Option Testing """
+    PARSER_KWARGS : ClassVar[Mapping[str, Any]] = MappingProxyType({
+        'prog': 'test',
+        'description': 'Test Parser',
+        'add_help': False,
+        'exit_on_error': False
+    })
+
     def setUp(self) -> None:
         """ Construct an argument parser """
-        self.parser = ArgumentParser(
-            description='Test Parser', exit_on_error=False
-        )
+        self.parser = ArgumentParser(**self.PARSER_KWARGS)
 
     def run_parser(self, args : list[str]) -> Namespace:
         """
@@ -29,7 +29,7 @@ class TestArgument(ArgumentTest):
         values = self.run_parser([value])
 
         self.assertEqual(values.group_name, value)
-        self.assertEqual(argument.get_value(name, group, values), value)
+        self.assertEqual(argument.get_value(name, group, vars(values)), value)
 
     def test_name_no_prefix(self):
         """ Use parameter name with no group prefix """
@@ -42,7 +42,7 @@ class TestArgument(ArgumentTest):
         values = self.run_parser([value])
 
         self.assertEqual(values.name, value)
-        self.assertEqual(argument.get_value(name, None, values), value)
+        self.assertEqual(argument.get_value(name, None, vars(values)), value)
 
     def test_name_with_disabled_prefix(self):
         """ Use parameter name with disabled group prefix """
@@ -56,7 +56,7 @@ class TestArgument(ArgumentTest):
         values = self.run_parser([value])
 
         self.assertEqual(values.name, value)
-        self.assertEqual(argument.get_value(name, group, values), value)
+        self.assertEqual(argument.get_value(name, group, vars(values)), value)
 
     def test_argument_converter(self):
         """ Convert argument value """
@@ -70,7 +70,7 @@ class TestArgument(ArgumentTest):
         values = self.run_parser([str(value)])
 
         self.assertEqual(values.group_name, value)
-        self.assertEqual(argument.get_value(name, group, values), value)
+        self.assertEqual(argument.get_value(name, group, vars(values)), value)
 
     def test_argument_converter_override(self):
         """ Convert argument value with explicit type argument """
@@ -86,7 +86,7 @@ class TestArgument(ArgumentTest):
         values = self.run_parser([str(value)])
 
         self.assertEqual(values.group_name, value)
-        self.assertEqual(argument.get_value(name, group, values), value)
+        self.assertEqual(argument.get_value(name, group, vars(values)), value)
 
     def test_missing(self):
         """ No argument value returns None """
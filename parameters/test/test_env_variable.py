@@ -81,6 +81,18 @@ class TestEnvVariable(unittest.TestCase):
         env_value = env.get_value(name, group, converter=int)
         self.assertEqual(env_value, value)
 
+    def test_environment_snapshot(self):
+        """ Get a value from an environment snapshot """
+        name = 'name'
+        group = 'group'
+        value = 'snapshot'
+
+        env_name = f"{group}_{name}".upper()
+
+        env = EnvVariable()
+        env_value = env.get_value(name, group, environment={env_name: value})
+        self.assertEqual(env_value, value)
+
     def test_missing(self):
         """ Missing environment variable returns None """
         name = 'name'
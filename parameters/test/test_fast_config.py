@@ -0,0 +1,182 @@
+"""
+Fast Configuration File Parser Unit Tests
+"""
+
+import unittest
+
+from configparser import MissingSectionHeaderError
+from pathlib import Path
+from sys import getdefaultencoding
+from typing import ClassVar
+
+from parameters.fast_config import FastConfigParser
+from parameters.fast_config import flatten_config, make_config_parser
+
+class TestFastConfig(unittest.TestCase):
+    """ Fast Configuration File Parser Test Suite """
+    FILENAME : ClassVar[Path] = Path(__file__).parent / 'test.ini'
+    SIMPLE : ClassVar[str] = '''
+# comment
+[DEFAULT]
+shared = everywhere
+
+[one]
+Name = value # inline comment
+empty =
+hash = a#b
+spaced key = x = y
+
+[two]
+name = other
+'''
+
+    def setUp(self) -> None:
+        """ Create parser """
+        self.parser = FastConfigParser()
+
+    def assert_same_as_config_parser(self, *texts : str) -> None:
+        """
+        Check that the fast parser agrees with ConfigParser
+
+        Arguments:
+            texts:
+                Configuration sources to read, in order.
+        """
+        parser = FastConfigParser()
+        config = make_config_parser()
+
+        for text in texts:
+            parser.read_string(text)
+            config.read_string(text)
+
+        self.assertEqual(flatten_config(parser), flatten_config(config))
+
+    def test_read_file(self):
+        """ Parse the test configuration file """
+        self.assertEqual(self.parser.read(self.FILENAME), [str(self.FILENAME)])
+        self.assertIsNone(self.parser.parser)
+
+        values = flatten_config(self.parser)
+
+        self.assertEqual(values['DEFAULT'], {'answer': '42'})
+        self.assertIs(values[None], values['DEFAULT'])
+        self.assertEqual(values['backup']['answer'], '42')
+        self.assertEqual(values['backup']['blocking'], '20')
+        self.assertEqual(values['backup']['targets'], 'home, etc, usr')
+        self.assertEqual(values['math']['pi'], '3.14')
+
+        with open(self.FILENAME, encoding=getdefaultencoding()) as source:
+            self.assert_same_as_config_parser(source.read())
+
+    def test_simple_subset(self):
+        """ Parse the supported subset without falling back """
+        defaults, sections = self.parser.parse(self.SIMPLE)
+
+        self.assertEqual(defaults, {'shared': 'everywhere'})
+        self.assertEqual(sections['one']['name'], 'value')
+        self.assertEqual(sections['one']['empty'], '')
+        self.assertEqual(sections['one']['hash'], 'a#b')
+        self.assertEqual(sections['one']['spaced key'], 'x = y')
+        self.assertEqual(sections['two'], {'name': 'other'})
+
+        self.assert_same_as_config_parser(self.SIMPLE)
+
+    def test_line_breaks(self):
+        """ Only newlines end lines, as for ConfigParser """
+        self.assert_same_as_config_parser('[b]\nq = \x0cw = 3\n')
+        self.assert_same_as_config_parser('[b]\nq = a\x85b\u2028c\n')
+        self.assert_same_as_config_parser('[b]\r\nq = 1\r\n')
+
+    def test_parse_cache(self):
+        """ Parse results are shared between parsers """
+        parsed = self.parser.parse(self.SIMPLE)
+
+        self.assertIs(FastConfigParser().parse(self.SIMPLE), parsed)
+        self.assertIsNot(
+            FastConfigParser(default_section='two').parse(self.SIMPLE),
+            parsed
+        )
+
+        self.parser.read_string(self.SIMPLE)
+        self.parser.read_string('[one]\nname = changed\n')
+        self.assertEqual(parsed[1]['one']['name'], 'value')
+
+        for number in range(100):
+            self.parser.parse(f"[one]\nname = {number}\n")
+        info = FastConfigParser.scan.cache_info()
+        self.assertLessEqual(info.currsize, info.maxsize)
+
+    def test_get(self):
+        """ Get values as ConfigParser does """
+        config = make_config_parser()
+        config.read_string(self.SIMPLE)
+        self.parser.read_string(self.SIMPLE)
+
+        lookups = [
+            ('one', 'NAME'),
+            ('one', 'shared'),
+            ('one', 'missing'),
+            ('DEFAULT', 'shared'),
+            ('DEFAULT', 'name'),
+            ('three', 'shared'),
+        ]
+
+        for section, option in lookups:
+            with self.subTest(section=section, option=option):
+                self.assertEqual(
+                    self.parser.has_option(section, option),
+                    config.has_option(section, option)
+                )
+                self.assertEqual(
+                    self.parser.get(section, option, fallback='none'),
+                    config.get(section, option, fallback='none')
+                )
+
+    def test_fallback(self):
+        """ Sources outside of the subset are handed to ConfigParser """
+        texts = [
+            '[one]\nname = first\n    second\n',
+            '[one]\n    name = value\n',
+            '[one]\nname = value\nother = ${name}\n',
+            '[one]\nname = $$\n',
+        ]
+
+        for text in texts:
+            with self.subTest(text=text):
+                self.assertIsNone(self.parser.parse(text))
+                self.assert_same_as_config_parser(text)
+
+    def test_no_interpolation(self):
+        """ Without interpolation '$' is an ordinary character """
+        text = '[one]\nname = ${two:name} costs $5\n'
+        parser = FastConfigParser(interpolation=False)
+        config = make_config_parser(interpolation=False)
+
+        parser.read_string(text)
+        config.read_string(text)
+
+        self.assertIsNone(parser.parser)
+        self.assertEqual(flatten_config(parser), flatten_config(config))
+        self.assertEqual(parser.get('one', 'name'), '${two:name} costs $5')
+
+    def test_multiple_sources(self):
+        """ Later sources override earlier ones, before and after handoff """
+        first = '[DEFAULT]\nanswer = 1\n[one]\nname = first\nkeep = yes\n'
+        second = '[DEFAULT]\nanswer = 2\n[one]\nname = second\n'
+        third = '[two]\nname = ${one:name}\n'
+
+        self.assert_same_as_config_parser(first, second)
+        self.assert_same_as_config_parser(first, third, second)
+
+        self.parser.read_string(first)
+        self.parser.read_string(third)
+        self.assertIsNotNone(self.parser.parser)
+        self.assertEqual(self.parser.get('two', 'name'), 'first')
+
+    def test_missing_section(self):
+        """ Errors are reported by ConfigParser """
+        with self.assertRaises(MissingSectionHeaderError):
+            self.parser.read_string('name = value\n')
+
+if __name__ == '__main__':
+    unittest.main()
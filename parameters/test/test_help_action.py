@@ -0,0 +1,35 @@
+"""
+Extended Help Action Unit Tests
+"""
+
+import unittest
+
+from parameters.help_action import HelpAction
+
+class TestHelpAction(unittest.TestCase):
+    """ Extended Help Action Unit Test Suite """
+    def test_standard_width(self):
+        """ Short names use the standard name column width """
+        lines = HelpAction.format_rows(
+            [('SHORT', 'first'), ('MIDDLE_NAME', 'second')]
+        ).split('\n')
+
+        column = 2 + HelpAction.NAME_WIDTH + 1
+        self.assertEqual(lines[0].index('first'), column)
+        self.assertEqual(lines[1].index('second'), column)
+
+    def test_long_name(self):
+        """ A long name widens the name column for all rows """
+        long_name = 'X' * (HelpAction.NAME_WIDTH + 9)
+
+        lines = HelpAction.format_rows(
+            [('SHORT', 'first'), (long_name, 'second'), ('EMPTY', None)]
+        ).split('\n')
+
+        column = 2 + len(long_name) + 1
+        self.assertEqual(lines[0].index('first'), column)
+        self.assertEqual(lines[1].index('second'), column)
+        self.assertEqual(lines[2], f"  {'EMPTY':<{len(long_name)}} ")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -20,6 +20,16 @@ class TestArgument(ArgumentTest):
         self.assertIsNone(option.help_or_mutex)
         self.assertEqual(option.kwargs, {})
 
+    def test_flags(self):
+        """ Construct the short and long option flags """
+        option = Option(short_name='n', short_prefix='x')
+        self.assertEqual(
+            option.get_flags('name', 'group'), ('-xn', '--group_name')
+        )
+
+        option = Option(use_prefix=False)
+        self.assertEqual(option.get_flags('name', 'group'), ('--name',))
+
     def test_long_name_with_prefix(self):
         """ Use parameter name with group prefix """
         name = 'name'
@@ -32,7 +42,7 @@ class TestArgument(ArgumentTest):
         values = self.run_parser([f"--{group}_{name}", value])
 
         self.assertEqual(values.group_name, value)
-        self.assertEqual(argument.get_value(name, group, values), value)
+        self.assertEqual(argument.get_value(name, group, vars(values)), value)
 
     def test_long_name_no_prefix(self):
         """ Use parameter name with no group prefix """
@@ -45,7 +55,7 @@ class TestArgument(ArgumentTest):
         values = self.run_parser([f"--{name}", value])
 
         self.assertEqual(values.name, value)
-        self.assertEqual(option.get_value(name, None, values), value)
+        self.assertEqual(option.get_value(name, None, vars(values)), value)
 
     def test_long_name_with_disabled_prefix(self):
         """ Use parameter name with disabled group prefix """
@@ -59,7 +69,7 @@ class TestArgument(ArgumentTest):
         values = self.run_parser([f"--{name}", value])
 
         self.assertEqual(values.name, value)
-        self.assertEqual(option.get_value(name, group, values), value)
+        self.assertEqual(option.get_value(name, group, vars(values)), value)
 
     def test_dest_override(self):
         """ Override name with dest argument """
@@ -73,7 +83,7 @@ class TestArgument(ArgumentTest):
         values = self.run_parser([f"--{group}_{name}", value])
 
         self.assertEqual(values.here, value)
-        self.assertEqual(argument.get_value(name, group, values), value)
+        self.assertEqual(argument.get_value(name, group, vars(values)), value)
 
     def test_short_name_with_prefix(self):
         """ Short name with prefix """
@@ -89,7 +99,9 @@ class TestArgument(ArgumentTest):
         values = self.run_parser([f"-{short_prefix}{short_name}", value])
 
         self.assertEqual(values.group_name, value)
-        self.assertEqual(argument.get_value(long_name, group, values), value)
+        self.assertEqual(
+            argument.get_value(long_name, group, vars(values)), value
+        )
 
     def test_short_name_with_no_prefix(self):
         """ Short name with no prefix """
@@ -104,7 +116,9 @@ class TestArgument(ArgumentTest):
         values = self.run_parser([f"-{short_name}", value])
 
         self.assertEqual(values.group_name, value)
-        self.assertEqual(argument.get_value(long_name, group, values), value)
+        self.assertEqual(
+            argument.get_value(long_name, group, vars(values)), value
+        )
 
     def test_option_converter(self):
         """ Convert option value """
@@ -118,7 +132,7 @@ class TestArgument(ArgumentTest):
         values = self.run_parser([f"--{group}_{name}", str(value)])
 
         self.assertEqual(values.group_name, value)
-        self.assertEqual(option.get_value(name, group, values), value)
+        self.assertEqual(option.get_value(name, group, vars(values)), value)
 
     def test_option_converter_override(self):
         """ Convert option value with explicit type argument """
@@ -134,7 +148,7 @@ class TestArgument(ArgumentTest):
         values = self.run_parser([f"--{group}_{name}", str(value)])
 
         self.assertEqual(values.group_name, value)
-        self.assertEqual(option.get_value(name, group, values), value)
+        self.assertEqual(option.get_value(name, group, vars(values)), value)
 
     def test_option_action_override(self):
         """ Disable converter with action override """
@@ -150,7 +164,7 @@ class TestArgument(ArgumentTest):
         values = self.run_parser([f"--{group}_{name}"])
 
         self.assertEqual(values.math_pi, value)
-        self.assertEqual(option.get_value(name, group, values), value)
+        self.assertEqual(option.get_value(name, group, vars(values)), value)
 
     def test_missing(self):
         """ No option value returns None """
@@ -7,9 +7,11 @@ import unittest
 from configparser import ConfigParser
 from os import environ
 from typing import ClassVar
+from unittest.mock import patch
 
 from parameters.argument import Argument
 from parameters.env_variable import EnvVariable
+from parameters.fast_config import ConfigValues
 from parameters.option import Option
 from parameters.parameter import Parameter
 from parameters.test.argument_test import ArgumentTest
@@ -30,11 +32,14 @@ class TestParameter(ArgumentTest):
     pi = 3.14
 '''
 
-    def setUp(self) -> None:
-        """ Setup parameter context """
-        super().setUp()
-        self.config = ConfigParser()
-        self.config.read_string(self.CONFIG)
+    config : ClassVar[ConfigValues]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """ Parse the configuration values once for the suite """
+        config = ConfigParser()
+        config.read_string(cls.CONFIG)
+        cls.config = ConfigValues(config)
 
     def test_default_state(self):
         """ Check the default state """
@@ -45,13 +50,16 @@ class TestParameter(ArgumentTest):
         self.assertEqual(parameter.name, name)
         self.assertIsNone(parameter.group)
         self.assertIsNone(parameter.arg)
+        self.assertIsNone(parameter.help_or_mutex)
         self.assertIsNone(parameter.env)
+        self.assertIsNone(parameter.env_name)
         self.assertFalse(parameter.config)
         self.assertIsNone(parameter.converter)
         self.assertIsNone(parameter.default)
         self.assertIsNone(parameter.help_text)
 
         self.assertEqual(parameter.get_full_name(), name)
+        self.assertEqual(parameter.full_name, name)
 
     def test_with_group(self):
         """ Check for group prefix in name """
@@ -61,6 +69,7 @@ class TestParameter(ArgumentTest):
         parameter = Parameter(name, group=group)
 
         self.assertEqual(parameter.get_full_name(), f"{group}_{name}")
+        self.assertEqual(parameter.full_name, f"{group}_{name}")
 
     def test_parameter_default_and_help(self):
         """ Parameter supplies default value and help text """
@@ -136,7 +145,7 @@ class TestParameter(ArgumentTest):
         )
         parameter.add_argument(self.parser)
         values = self.run_parser(['hello'])
-        value = parameter.get_value(values, self.config)
+        value = parameter.get_value(vars(values), self.config)
         self.assertEqual(value, 'hello')
 
     def test_option_no_converter(self):
@@ -149,7 +158,7 @@ class TestParameter(ArgumentTest):
         )
         parameter.add_argument(self.parser)
         values = self.run_parser(['-x', 'world'])
-        value = parameter.get_value(values, self.config)
+        value = parameter.get_value(vars(values), self.config)
         self.assertEqual(value, 'world')
 
     def test_argument_parameter_converter(self):
@@ -163,7 +172,7 @@ class TestParameter(ArgumentTest):
         )
         parameter.add_argument(self.parser)
         values = self.run_parser(['42'])
-        value = parameter.get_value(values, self.config)
+        value = parameter.get_value(vars(values), self.config)
         self.assertEqual(value, 42)
 
     def test_option_parameter_converter(self):
@@ -177,7 +186,7 @@ class TestParameter(ArgumentTest):
         )
         parameter.add_argument(self.parser)
         values = self.run_parser(['-x', '42'])
-        value = parameter.get_value(values, self.config)
+        value = parameter.get_value(vars(values), self.config)
         self.assertEqual(value, 42)
 
     def test_argument_converter(self):
@@ -191,7 +200,7 @@ class TestParameter(ArgumentTest):
         )
         parameter.add_argument(self.parser)
         values = self.run_parser(['42'])
-        value = parameter.get_value(values, self.config)
+        value = parameter.get_value(vars(values), self.config)
         self.assertEqual(value, 42)
 
     def test_option_converter(self):
@@ -205,7 +214,7 @@ class TestParameter(ArgumentTest):
         )
         parameter.add_argument(self.parser)
         values = self.run_parser(['-x', '42'])
-        value = parameter.get_value(values, self.config)
+        value = parameter.get_value(vars(values), self.config)
         self.assertEqual(value, 42)
 
     def test_not_found(self):
@@ -219,7 +228,7 @@ class TestParameter(ArgumentTest):
         )
         parameter.add_argument(self.parser)
         values = self.run_parser([])
-        value = parameter.get_value(values, self.config)
+        value = parameter.get_value(vars(values), self.config)
         self.assertIsNone(value)
 
     def test_default_value(self):
@@ -234,7 +243,7 @@ class TestParameter(ArgumentTest):
         )
         parameter.add_argument(self.parser)
         values = self.run_parser([])
-        value = parameter.get_value(values, self.config)
+        value = parameter.get_value(vars(values), self.config)
         self.assertEqual(value, 'not found')
 
     def test_default_config_value(self):
@@ -248,7 +257,7 @@ class TestParameter(ArgumentTest):
         )
         parameter.add_argument(self.parser)
         values = self.run_parser([])
-        value = parameter.get_value(values, self.config)
+        value = parameter.get_value(vars(values), self.config)
         self.assertEqual(value, 'value')
 
     def test_config_value(self):
@@ -264,7 +273,18 @@ class TestParameter(ArgumentTest):
         )
         parameter.add_argument(self.parser)
         values = self.run_parser([])
-        value = parameter.get_value(values, self.config)
+        value = parameter.get_value(vars(values), self.config)
+        self.assertEqual(value, 42)
+
+    def test_mixed_case_config_value(self):
+        """ Match a mixed-case name to a lowercased configuration option """
+        parameter = Parameter(
+            name='Answer',
+            group='group1',
+            config=True,
+            converter=int
+        )
+        value = parameter.get_value({}, self.config)
         self.assertEqual(value, 42)
 
     def test_alternate_config_value(self):
@@ -284,13 +304,20 @@ class TestParameter(ArgumentTest):
         parameter.add_argument(self.parser)
 
         values = self.run_parser(['group2'])
-        value = parameter.get_value(values, self.config)
+        value = parameter.get_value(vars(values), self.config)
         self.assertEqual(value, 3.14)
 
+    def test_unresolved_alternate_section(self):
+        """ No configuration value if the alternate section has no value """
+        section = Parameter(name='section')
+        parameter = Parameter(name='name', config=section, default='none')
+
+        value = parameter.get_value({}, self.config)
+        self.assertEqual(value, 'none')
+
+    @patch.dict(environ, {'GROUP1_ANSWER': '100'})
     def test_environment_value(self):
         """ Accept a value from an environment variable """
-        environ['GROUP1_ANSWER'] = '100'
-
         parameter = Parameter(
             name='answer',
             group='group1',
@@ -302,14 +329,15 @@ class TestParameter(ArgumentTest):
         )
         parameter.add_argument(self.parser)
 
+        self.assertEqual(parameter.env_name, 'GROUP1_ANSWER')
+
         values = self.run_parser([])
-        value = parameter.get_value(values, self.config)
+        value = parameter.get_value(vars(values), self.config)
         self.assertEqual(value, 100)
 
+    @patch.dict(environ, {'GROUP1_ANSWER': '100'})
     def test_option_value(self):
         """ Accept a value from a command line option """
-        environ['GROUP1_ANSWER'] = '100'
-
         parameter = Parameter(
             name='answer',
             group='group1',
@@ -322,7 +350,7 @@ class TestParameter(ArgumentTest):
         parameter.add_argument(self.parser)
 
         values = self.run_parser(['--group1_answer', '1234'])
-        value = parameter.get_value(values, self.config)
+        value = parameter.get_value(vars(values), self.config)
         self.assertEqual(value, 1234)
 
 if __name__ == '__main__':
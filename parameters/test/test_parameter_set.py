@@ -5,22 +5,30 @@ Parameter Set Unit Tests
 import unittest
 
 from argparse import ArgumentError
-from os import environ
+from contextlib import redirect_stdout
+from io import StringIO
+from os import chdir, environ, getcwd
 from pathlib import Path
 from sys import getdefaultencoding
+from tempfile import TemporaryDirectory
 from typing import ClassVar
+from unittest.mock import patch
 
+from parameters.argument import Argument
 from parameters.option import Option
 from parameters.env_variable import EnvVariable
 from parameters.parameter import Parameter
 from parameters.parameter_set import ParameterSet
 
+from utility import is_windows
 from utility.str2list import Str2List
 from utility.str2bool import str2bool
 
 class TestParameterSet(unittest.TestCase):
     """ Parameter Set Test Suite """
-    PARAMETERS : ClassVar[list[Parameter]] = [
+    FAST : ClassVar[bool] = False
+
+    PARAMETERS : ClassVar[tuple[Parameter, ...]] = (
         Parameter(
             name='input_file',
             arg=Option(short_name='f'),
@@ -105,28 +113,34 @@ class TestParameterSet(unittest.TestCase):
             converter=float,
             default=2.71828
         ),
-    ]
+    )
+
+    FILENAME : ClassVar[Path] = Path(__file__).parent / 'test.ini'
+    FILENAME_STR : ClassVar[str] = str(FILENAME)
+    ini_text : ClassVar[str]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """ Read the test configuration file once for the suite """
+        cls.ini_text = cls.read_ini_file()
 
     def setUp(self) -> None:
         """ Create parameter set """
         self.parameters = ParameterSet(
-            description='Test Parameters', exit_on_error=False
+            fast=self.FAST, description='Test Parameters', exit_on_error=False
         )
         self.parameters.add_parameters(self.PARAMETERS)
-        self.filename = Path(__file__).parent / 'test.ini'
 
-    def read_ini_file(self) -> str:
+    @classmethod
+    def read_ini_file(cls) -> str:
         """ Read the test configuration file """
-        with open(self.filename, encoding=getdefaultencoding()) as source:
-            config = source.read()
-
-        return config
+        return cls.FILENAME.read_bytes().decode(getdefaultencoding())
 
     def test_arguments(self):
         """ All values from the command line """
         values = self.parameters.collect_values(
             [
-                '-f', str(self.filename),
+                '-f', self.FILENAME_STR,
                 '-A', '1962',
                 '--remote', 'backup.ngc.com',
                 '--tape', '/dev/st1',
@@ -138,7 +152,7 @@ class TestParameterSet(unittest.TestCase):
             config=self.PARAMETERS[0]
         )
 
-        self.assertEqual(values['input_file'], str(self.filename))
+        self.assertEqual(values['input_file'], self.FILENAME_STR)
         self.assertEqual(values['answer'], 1962)
         self.assertEqual(values['backup_remote'], 'backup.ngc.com')
         self.assertEqual(values['backup_tape'], '/dev/st1')
@@ -149,17 +163,18 @@ class TestParameterSet(unittest.TestCase):
         self.assertEqual(values['math_pi'], 3.14)
         self.assertEqual(values['math_euler'], 2.72)
 
+    @patch.dict(environ, {
+        'EVERYTHING': '99',
+        'INPUT_FILE': FILENAME_STR,
+        'BACKUP_REMOTE': 'somewhere.google.com',
+        'BACKUP_TAPE': '/dev/st2',
+        'BACKUP_BLOCKING': '100',
+    })
     def test_environment(self):
         """ All values from the environment variables """
-        environ['EVERYTHING'] = '99'
-        environ['INPUT_FILE'] = str(self.filename)
-        environ['BACKUP_REMOTE'] = 'somewhere.google.com'
-        environ['BACKUP_TAPE'] = '/dev/st2'
-        environ['BACKUP_BLOCKING'] = '100'
-
         values = self.parameters.collect_values([], config=self.PARAMETERS[0])
 
-        self.assertEqual(values['input_file'], str(self.filename))
+        self.assertEqual(values['input_file'], self.FILENAME_STR)
         self.assertEqual(values['answer'], 99)
         self.assertEqual(values['backup_remote'], 'somewhere.google.com')
         self.assertEqual(values['backup_tape'], '/dev/st2')
@@ -170,17 +185,11 @@ class TestParameterSet(unittest.TestCase):
         self.assertEqual(values['math_pi'], 3.14)
         self.assertEqual(values['math_euler'], 2.72)
 
-        environ.pop('EVERYTHING')
-        environ.pop('INPUT_FILE')
-        environ.pop('BACKUP_REMOTE')
-        environ.pop('BACKUP_TAPE')
-        environ.pop('BACKUP_BLOCKING')
-
     def test_config(self):
         """ All values from the configuration file """
         values = self.parameters.collect_values(
             [],
-            config=self.read_ini_file()
+            config=self.ini_text
         )
 
         self.assertIsNone(values['input_file'])
@@ -194,6 +203,229 @@ class TestParameterSet(unittest.TestCase):
         self.assertEqual(values['math_pi'], 3.14)
         self.assertEqual(values['math_euler'], 2.72)
 
+    def test_lazy_config(self):
+        """ The configuration parser is only constructed when needed """
+        # pylint: disable=protected-access
+        values = self.parameters.collect_values(['-b', '5'])
+
+        self.assertIsNone(self.parameters._config)
+        self.assertEqual(values['answer'], -1)
+        self.assertEqual(values['math_pi'], 3.14159)
+
+        values = self.parameters.collect_values(
+            ['-b', '5'], config=self.PARAMETERS[0]
+        )
+        self.assertIsNone(self.parameters._config)
+        self.assertIsNone(values['input_file'])
+
+        self.parameters.collect_values([], config=self.FILENAME)
+        self.assertIsNotNone(self.parameters._config)
+
+    def test_empty_arguments(self):
+        """ An empty command line is resolved without parsing """
+        empty = self.parameters.get_empty_values()
+
+        self.assertEqual(
+            empty, vars(self.parameters.arguments.parse_args([]))
+        )
+        values = self.parameters.parse_arguments([])
+        self.assertEqual(values, empty)
+        self.assertIs(self.parameters.parse_arguments([]), values)
+
+        self.parameters.add_parameters((
+            Parameter(name='verbose', arg=Option(action='store_true')),
+            Parameter(
+                name='quiet',
+                arg=Option(action='store_false', dest='verbose')
+            )
+        ))
+        empty = self.parameters.get_empty_values()
+        self.assertEqual(
+            empty, vars(self.parameters.arguments.parse_args([]))
+        )
+        self.assertFalse(empty['verbose'])
+
+        self.parameters.collect_values([])
+        self.parameters.arguments.set_defaults(verbose=True, extra=7)
+        values = self.parameters.parse_arguments([])
+        self.assertEqual(
+            values, vars(self.parameters.arguments.parse_args([]))
+        )
+        self.assertTrue(values['verbose'])
+        self.assertEqual(values['extra'], 7)
+
+        self.parameters.add_parameters(
+            Parameter(name='target', arg=Argument(nargs='?'))
+        )
+        self.assertFalse(self.parameters.get_empty_values())
+        self.assertEqual(
+            self.parameters.parse_arguments([]), {**values, 'target': None}
+        )
+
+    def test_no_interpolation(self):
+        """ Configuration values are taken as is without interpolation """
+        parameters = ParameterSet(fast=self.FAST, interpolation=False)
+        parameters.add_parameters(self.PARAMETERS)
+
+        values = parameters.collect_values(
+            [], config='[backup]\nremote = ${host}\n'
+        )
+
+        self.assertEqual(values['backup_remote'], '${host}')
+
+    def test_unrelated_config(self):
+        """ Options that no parameter reads are not interpolated """
+        values = self.parameters.collect_values(
+            [],
+            config=(
+                '[backup]\nremote = ${other:host}\n'
+                '[other]\nhost = x\nref = ${nosuch:key}\n'
+                'password = pa$$word\n'
+            )
+        )
+
+        self.assertEqual(values['backup_remote'], 'x')
+
+    def test_interpolated_sections(self):
+        """ Only the sections that are read are interpolated """
+        parameters = ParameterSet(fast=self.FAST)
+        parameters.add_parameters((
+            Parameter(name='path', group='a', config=True),
+            Parameter(name='host', group='backup', config=True)
+        ))
+
+        values = parameters.collect_values(
+            [],
+            config=(
+                '[DEFAULT]\npath = ${home}/x\n'
+                '[a]\nhome = /h\n'
+                '[backup]\nhost = srv\n'
+                '[other]\nhost = ${nosuch:key}\n'
+            )
+        )
+
+        self.assertEqual(values['a_path'], '/h/x')
+        self.assertEqual(values['backup_host'], 'srv')
+
+    def test_config_file(self):
+        """ Values from a configuration file path """
+        values = self.parameters.collect_values([], config=self.FILENAME)
+
+        self.assertEqual(values['answer'], 42)
+        self.assertEqual(values['backup_targets'], ['home', 'etc', 'usr'])
+        self.assertEqual(values['math_euler'], 2.72)
+
+    def test_source_cache(self):
+        """ Configuration files are only reread when they change """
+        with TemporaryDirectory() as directory:
+            filename = Path(directory) / 'cached.ini'
+            filename.write_text('answer = 1\n', encoding=getdefaultencoding())
+
+            text = ParameterSet.read_source_text(filename)
+            self.assertIs(ParameterSet.read_source_text(filename), text)
+
+            filename.write_text('answer = 22\n', encoding=getdefaultencoding())
+
+            self.assertEqual(
+                ParameterSet.read_source_text(filename), 'answer = 22\n'
+            )
+
+    def test_repeat_collection(self):
+        """ Repeated collections reuse values until their inputs change """
+        args = ['-b', '5']
+
+        with TemporaryDirectory() as directory:
+            filename = Path(directory) / 'repeat.ini'
+            filename.write_text(
+                '[DEFAULT]\nanswer = 1\n', encoding=getdefaultencoding()
+            )
+
+            first = self.parameters.collect_values(args, config=filename)
+            with patch.object(ParameterSet, 'read_source') as reader:
+                second = self.parameters.collect_values(args, config=filename)
+            reader.assert_not_called()
+
+            self.assertEqual(first, second)
+            self.assertIsNot(first, second)
+
+            filename.write_text(
+                '[DEFAULT]\nanswer = 22\n', encoding=getdefaultencoding()
+            )
+            values = self.parameters.collect_values(args, config=filename)
+            self.assertEqual(values['answer'], 22)
+
+            values = self.parameters.collect_values(['-b', '6'], filename)
+            self.assertEqual(values['backup_blocking'], 6)
+
+            with patch.dict(environ, {'BACKUP_TAPE': '/dev/st9'}):
+                values = self.parameters.collect_values(['-b', '6'], filename)
+            self.assertEqual(values['backup_tape'], '/dev/st9')
+
+    def test_repeat_collection_directory(self):
+        """ A relative configuration file follows the working directory """
+        cwd = getcwd()
+
+        with TemporaryDirectory() as directory:
+            for answer in ('1', '2'):
+                Path(directory, answer).mkdir()
+                Path(directory, answer, 'c.ini').write_text(
+                    f"[DEFAULT]\nanswer = {answer}\n",
+                    encoding=getdefaultencoding()
+                )
+
+            try:
+                for answer in (1, 2):
+                    chdir(Path(directory, str(answer)))
+                    values = self.parameters.collect_values(
+                        [], config=Path('c.ini')
+                    )
+                    self.assertEqual(values['answer'], answer)
+            finally:
+                chdir(cwd)
+
+    @unittest.skipIf(is_windows, 'symbolic links need privileges')
+    def test_switched_link(self):
+        """ A configuration file link that is switched is followed """
+        with TemporaryDirectory() as directory:
+            link = Path(directory) / 'c.ini'
+
+            for answer in (1, 2):
+                target = Path(directory) / f"c{answer}.ini"
+                target.write_text(
+                    f"[DEFAULT]\nanswer = {answer}\n",
+                    encoding=getdefaultencoding()
+                )
+                link.unlink(missing_ok=True)
+                link.symlink_to(target)
+
+                fresh = ParameterSet()
+                fresh.add_parameters(self.PARAMETERS[1])
+
+                for parameters in (self.parameters, fresh):
+                    values = parameters.collect_values([], config=link)
+                    self.assertEqual(values['answer'], answer)
+
+    def test_repeat_collection_config(self):
+        """ Direct use of the configuration parser is not ignored """
+        values = self.parameters.collect_values([])
+        self.assertEqual(values['math_pi'], 3.14159)
+
+        self.parameters.config.read_string('[math]\npi = 3.14\n')
+
+        values = self.parameters.collect_values([])
+        self.assertEqual(values['math_pi'], 3.14)
+
+    def test_repeat_collection_copies(self):
+        """ Repeated collections do not share converted values """
+        for args in ([], ['-T', 'var, local']):
+            with self.subTest(args=args):
+                first = self.parameters.collect_values(args, self.ini_text)
+                expected = list(first['backup_targets'])
+                first['backup_targets'].append('MUTATED')
+
+                second = self.parameters.collect_values(args, self.ini_text)
+                self.assertEqual(second['backup_targets'], expected)
+
     def test_defaults(self):
         """ All values from the default values """
         values = self.parameters.collect_values([])
@@ -209,7 +441,45 @@ class TestParameterSet(unittest.TestCase):
         self.assertEqual(values['math_pi'], 3.14159)
         self.assertEqual(values['math_euler'], 2.71828)
 
-    GROUPED : ClassVar[list[Parameter]] = [
+    def test_redefine(self):
+        """ A redefined parameter replaces the original in place """
+        self.parameters.add_parameters(
+            Parameter(name='pi', group='math', default=3.0)
+        )
+
+        values = self.parameters.collect_values([])
+
+        self.assertEqual(list(values), list(self.parameters.parameters))
+        self.assertEqual(values['math_pi'], 3.0)
+        self.assertNotIn('math_pi', self.parameters.config_help)
+
+        env_help = list(self.parameters.env_help)
+        config_help = list(self.parameters.config_help)
+        self.parameters.add_parameters(
+            Parameter(
+                name='answer',
+                env=EnvVariable(name='EVERYTHING'),
+                config=True,
+                converter=int
+            )
+        )
+
+        self.assertEqual(list(self.parameters.env_help), env_help)
+        self.assertEqual(list(self.parameters.config_help), config_help)
+
+    def test_help(self):
+        """ Help option lists all parameter sources """
+        output = StringIO()
+
+        with redirect_stdout(output), self.assertRaises(SystemExit) as error:
+            self.parameters.collect_values(['--help'])
+
+        self.assertEqual(error.exception.code, 0)
+        self.assertIn('--input_file', output.getvalue())
+        self.assertIn('EVERYTHING', output.getvalue())
+        self.assertIn('math_euler', output.getvalue())
+
+    GROUPED : ClassVar[tuple[Parameter, ...]] = (
         Parameter(
             name='one',
             arg=Option(help_or_mutex='together'),
@@ -230,7 +500,7 @@ class TestParameterSet(unittest.TestCase):
             arg=Option(help_or_mutex='apart'),
             converter=int
         )
-    ]
+    )
 
     def add_groups(self):
         """ Add help and mutex groups """
@@ -275,5 +545,9 @@ class TestParameterSet(unittest.TestCase):
             'argument --four: not allowed with argument --two'
         )
 
+class TestFastParameterSet(TestParameterSet):
+    """ Parameter Set Test Suite with the Fast Configuration Parser """
+    FAST : ClassVar[bool] = True
+
 if __name__ == '__main__':
     unittest.main()
@@ -3,10 +3,14 @@ Utilities
 
 This module contains other miscellaneous helpful things that don't seem to
 have a home anywhere else.  The flags defined here can be used to help code
-adapt depending on which OS it is running.
+adapt depending on which OS it is running.  The system name is looked up once
+and is also available as is for other checks.
 """
 
 import platform
 
-is_linux = (platform.system() == 'Linux')
-is_windows = (platform.system() == 'Windows')
+system_name = platform.system()
+
+is_linux = (system_name == 'Linux')
+is_windows = (system_name == 'Windows')
+is_darwin = (system_name == 'Darwin')
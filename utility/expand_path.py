@@ -2,9 +2,18 @@
 Resolve File Paths
 
 This method accepts a path or string and expands it to an absolute path.  Any
-leading '~' is expanded as expected.
+leading '~' is expanded as expected.  The work is done on strings with the
+os.path functions and only the result is converted to a Path.
+
+Paths that are not required to exist are cached.  The cache key is the path
+after '~' expansion and, for relative paths, the current working directory, so
+changing either directory still produces the correct result.  Symbolic links
+are assumed not to change while the application runs; expand_path.cache_clear()
+discards the cached results if they do.
 """
 
+from functools import lru_cache
+import os
 from pathlib import Path
 from typing import Optional, Union
 
@@ -18,17 +27,52 @@ def expand_path(
     Arguments:
         path:
             File path to be expanded.  Defaults to None (the current working
-            directory).
+            directory).  RuntimeError is raised if a leading '~' cannot be
+            expanded (for example, an unknown user).
         must_exist:
-            The strict argument to resolve().  If True then the resulting
-            absolute file path must exist.  Defaults to False.
+            If True then the resulting absolute file path must exist
+            (FileNotFoundError is raised if it does not).  Defaults to False.
 
     Returns:
         Path:
             Fully resolved (no links) file path with any leading '~' expanded
             as expected.
     """
-    if not path:
-        path = Path.cwd()
+    path = os.fspath(path) if path else os.getcwd()
+    expanded = os.path.expanduser(path)
+
+    if expanded[:1] == '~':
+        raise RuntimeError('Could not determine home directory.')
+
+    if must_exist:
+        resolved = os.path.realpath(expanded)
+        os.stat(resolved)
+        return Path(resolved)
+
+    if os.path.isabs(expanded):
+        return resolve_path(expanded, None)
+
+    return resolve_path(expanded, os.getcwd())
+
+@lru_cache(maxsize=128)
+def resolve_path(
+    path : str,
+    cwd : Optional[str]
+) -> Path:
+    """
+    Resolve an expanded file path (cached)
+
+    Arguments:
+        path:
+            File path with any leading '~' already expanded.
+        cwd:
+            Current working directory for a relative path, otherwise None.
+            Only used as part of the cache key.
+
+    Returns:
+        Fully resolved (no links) file path.
+    """
+    # pylint: disable=unused-argument
+    return Path(os.path.realpath(path))
 
-    return Path(path).expanduser().resolve(strict=bool(must_exist))
+expand_path.cache_clear = resolve_path.cache_clear
@@ -3,9 +3,14 @@ Convert String to Boolean
 
 Converts a set of case-insensitive truthy values to True.  Abbreviations are
 not supported.  Everything else converts to False.
+
+Configuration files and environment variables tend to repeat the same few
+values, so string conversions are cached.
 """
 
-TRUTHY = ['true', 't', 'yes', 'y', 'on']
+from functools import lru_cache
+
+TRUTHY = frozenset(('true', 't', 'yes', 'y', 'on'))
 
 def str2bool(value : str):
     """
@@ -24,10 +29,26 @@ def str2bool(value : str):
     if not isinstance(value, str):
         return False
 
-    try:
-        converted = int(value)
-        return bool(converted)
-    except (ValueError, TypeError):
-        pass
+    return _convert_str(value)
+
+@lru_cache(maxsize=64)
+def _convert_str(value : str) -> bool:
+    """
+    Convert string to boolean (cached)
+
+    Arguments:
+        value:
+            String value to be converted (see str2bool).
+
+    Returns:
+        The resulting boolean value.
+    """
+    # Words never convert to integers, so only try those that might
+    if not value[:1].isalpha():
+        try:
+            converted = int(value)
+            return bool(converted)
+        except (ValueError, TypeError):
+            pass
 
     return value.lower() in TRUTHY
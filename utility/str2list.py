@@ -11,18 +11,19 @@ from typing import Any, Callable, Optional
 class Str2List:
     """ Convert String to List """
     # pylint: disable=too-few-public-methods
+    __slots__ = ('delimiter', 'strip', 'allow_blank', 'converter')
 
     delimiter : str
     strip : bool
     allow_blank : bool
-    converter : Callable[[str], Any]
+    converter : Optional[Callable[[str], Any]]
 
     def __init__(
         self,
         delimiter : Optional[str] = None,
-        strip : Optional[bool] = True,
-        allow_blank: Optional[bool] = False,
-        converter : Callable[[str], Any] = None
+        strip : bool = True,
+        allow_blank : bool = False,
+        converter : Optional[Callable[[str], Any]] = None
     ):
         """
         Initialize converter
@@ -32,17 +33,18 @@ class Str2List:
                 Token delimiter (for split()).  Defaults to None (comma).
             strip:
                 If True then leading and trailing whitespace is stripped from
-                each resulting token.
+                each resulting token.  Defaults to True.
             allow_blank:
                 If True then blank tokens between delimiters are preserved.
                 This also causes a blank string to result in one blank token.
+                Defaults to False.
             converter:
                 A converter that is applied to each token.  Defaults to None
                 (return original string values).
         """
         self.delimiter = delimiter or ','
-        self.strip = bool(strip)
-        self.allow_blank = bool(allow_blank)
+        self.strip = strip
+        self.allow_blank = allow_blank
         self.converter = converter
 
     def __call__(self, value : str) -> list[Any]:
@@ -62,14 +64,25 @@ class Str2List:
             return []
 
         parts = value.split(self.delimiter)
+        allow_blank = self.allow_blank
+        converter = self.converter
 
+        # Strip, filter, and convert in a single pass
         if self.strip:
-            parts = [part.strip() for part in parts]
+            if converter:
+                return [
+                    converter(token) for part in parts
+                    if (token := part.strip()) or allow_blank
+                ]
+            return [
+                token for part in parts
+                if (token := part.strip()) or allow_blank
+            ]
 
-        if not self.allow_blank:
-            parts = [part for part in parts if part]
+        if converter:
+            return [converter(part) for part in parts if part or allow_blank]
 
-        if self.converter:
-            parts = [self.converter(part) for part in parts]
+        if allow_blank:
+            return parts
 
-        return parts
+        return [part for part in parts if part]
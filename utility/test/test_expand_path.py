@@ -7,6 +7,7 @@ import unittest
 import os
 from pathlib import Path
 from typing import ClassVar
+from unittest.mock import patch
 
 from utility import is_windows
 from utility.expand_path import expand_path
@@ -14,6 +15,14 @@ from utility.expand_path import expand_path
 class TestExpandPath(unittest.TestCase):
     """ Expand Path Test Suite """
     PARENT : ClassVar[Path] = Path(__file__).parent
+    parent_resolved : ClassVar[Path]
+    utility_resolved : ClassVar[Path]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """ Resolve the expected directories once for the suite """
+        cls.parent_resolved = cls.PARENT.resolve()
+        cls.utility_resolved = cls.parent_resolved.parent
 
     def test_current_directory(self):
         """ Return the current working directory by default """
@@ -29,13 +38,13 @@ class TestExpandPath(unittest.TestCase):
     def test_expand_absolute(self):
         """ Expand absolute existing path """
         expanded = expand_path(self.PARENT, must_exist=True)
-        self.assertEqual(expanded, self.PARENT)
+        self.assertEqual(expanded, self.parent_resolved)
 
     def test_expand_relative(self):
         """ Expand a relative existing path """
         path =  self.PARENT / '../..' / 'utility' / '.' / 'expand_path.py'
         resolved = expand_path(path, must_exist=True)
-        self.assertEqual(resolved, self.PARENT.parent / 'expand_path.py')
+        self.assertEqual(resolved, self.utility_resolved / 'expand_path.py')
 
     def test_expand_no_exist(self):
         """ Expand to a non-existent path """
@@ -45,7 +54,44 @@ class TestExpandPath(unittest.TestCase):
             resolved = expand_path(path, must_exist=True)
 
         resolved = expand_path(path)
-        self.assertEqual(resolved, self.PARENT.parent / 'xyzzy')
+        self.assertEqual(resolved, self.utility_resolved / 'xyzzy')
+
+    def test_cache(self):
+        """ Cached results follow the current working directory """
+        path = Path('xyzzy')
+        cwd = Path.cwd()
+
+        expanded = expand_path(path)
+        self.assertIs(expand_path(path), expanded)
+        self.assertEqual(expanded, cwd / 'xyzzy')
+
+        os.chdir(self.PARENT)
+        try:
+            self.assertEqual(expand_path(path), self.parent_resolved / 'xyzzy')
+        finally:
+            os.chdir(cwd)
+
+        expand_path.cache_clear()
+        self.assertIsNot(expand_path(path), expanded)
+
+    def test_cache_home(self):
+        """ Cached results follow the home directory """
+        name = 'USERPROFILE' if is_windows else 'HOME'
+
+        with patch.dict(os.environ, {name: str(self.PARENT)}):
+            expanded = expand_path('~/xyzzy')
+        self.assertEqual(expanded, self.parent_resolved / 'xyzzy')
+
+        self.assertEqual(
+            expand_path('~/xyzzy'), Path(os.environ[name]).resolve() / 'xyzzy'
+        )
+
+    def test_unknown_user(self):
+        """ A '~user' path that cannot be expanded is an error """
+        for must_exist in (False, True):
+            with self.subTest(must_exist=must_exist):
+                with self.assertRaises(RuntimeError):
+                    expand_path('~xyzzy-no-such-user/plugh', must_exist)
 
 if __name__ == '__main__':
     unittest.main()
@@ -4,25 +4,72 @@ String to List Unit Tests
 
 import unittest
 
+from typing import ClassVar
+
 from utility.str2list import Str2List
 
 class TestStr2List(unittest.TestCase):
     """ String to List Test Suite """
+    csv : ClassVar[Str2List]
+    ints : ClassVar[Str2List]
+    bars : ClassVar[Str2List]
+    no_strip : ClassVar[Str2List]
+    blanks : ClassVar[Str2List]
+    no_strip_blanks : ClassVar[Str2List]
+    converters : ClassVar[dict[tuple[bool, bool], Str2List]]
+
+    MIXED : ClassVar[str] = '  abc  ,defg,, ,1234  '
+    BLANK : ClassVar[str] = '   ,    ,,      '
+
+    # ((strip, allow_blank), value, expected)
+    MATRIX : ClassVar[tuple[tuple, ...]] = (
+        ((True, False), MIXED, ['abc', 'defg', '1234']),
+        ((True, False), BLANK, []),
+        ((False, False), MIXED, ['  abc  ', 'defg', ' ', '1234  ']),
+        ((False, False), None, []),
+        ((False, False), '', []),
+        ((False, False), BLANK, ['   ', '    ', '      ']),
+        ((True, True), MIXED, ['abc', 'defg', '', '', '1234']),
+        ((True, True), None, []),
+        ((True, True), '', ['']),
+        ((True, True), BLANK, ['', '', '', '']),
+        ((False, True), MIXED, ['  abc  ', 'defg', '', ' ', '1234  ']),
+        ((False, True), None, []),
+        ((False, True), '', ['']),
+        ((False, True), BLANK, ['   ', '    ', '', '      ']),
+    )
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """ Construct the converters once for the suite """
+        cls.csv = Str2List()
+        cls.ints = Str2List(converter=int)
+        cls.bars = Str2List(delimiter='|')
+        cls.no_strip = Str2List(strip=False)
+        cls.blanks = Str2List(allow_blank=True)
+        cls.no_strip_blanks = Str2List(strip=False, allow_blank=True)
+        cls.converters = {
+            (True, False): cls.csv,
+            (False, False): cls.no_strip,
+            (True, True): cls.blanks,
+            (False, True): cls.no_strip_blanks,
+        }
+
     def test_comma_list(self):
         """ Comma delimiters, stripping, no blanks, no converter """
-        converter = Str2List()
+        converter = self.csv
         values = converter('  abc  ,defg,  1234  ')
         self.assertEqual(values, ['abc', 'defg', '1234'])
 
     def test_integer_list(self):
         """ Comma delimiters, stripping, no blanks, with converter """
-        converter = Str2List(converter=int)
+        converter = self.ints
         values = converter('123,  42,  99,  -1   ')
         self.assertEqual(values, [123, 42, 99, -1])
 
     def test_empty_list(self):
         """ Comma delimiters, stripping, no blanks, no converter, empty list """
-        converter = Str2List()
+        converter = self.csv
 
         values = converter(None)
         self.assertEqual(values, [])
@@ -35,54 +82,18 @@ class TestStr2List(unittest.TestCase):
 
     def test_alternate_delimiter(self):
         """ Bar delimiters, stripping, no blanks, no converter """
-        converter = Str2List(delimiter='|')
+        converter = self.bars
         values = converter('one, two, three | four, five | six')
         self.assertEqual(values, ['one, two, three', 'four, five', 'six'])
 
-    def test_no_stripping(self):
-        """ Comma delimiters, no stripping, no blanks, no converter """
-        converter = Str2List(strip=False)
-        values = converter('  abc  ,defg,, ,1234  ')
-        self.assertEqual(values, ['  abc  ', 'defg', ' ', '1234  '])
-
-        values = converter(None)
-        self.assertEqual(values, [])
-
-        values = converter('')
-        self.assertEqual(values, [])
-
-        values = converter('   ,    ,,      ')
-        self.assertEqual(values, ['   ', '    ', '      '])
-
-    def test_blanks(self):
-        """ Comma delimiters, stripping, blanks, no converter """
-        converter = Str2List(allow_blank=True)
-        values = converter('  abc  ,defg,, ,1234  ')
-        self.assertEqual(values, ['abc', 'defg', '', '', '1234'])
-
-        values = converter(None)
-        self.assertEqual(values, [])
-
-        values = converter('')
-        self.assertEqual(values, [''])
-
-        values = converter('   ,    ,,      ')
-        self.assertEqual(values, ['', '', '', ''])
-
-    def test_no_stripping_blanks(self):
-        """ Comma delimiters, no stripping, blanks, no converter """
-        converter = Str2List(strip=False, allow_blank=True)
-        values = converter('  abc  ,defg,, ,1234  ')
-        self.assertEqual(values, ['  abc  ', 'defg', '', ' ', '1234  '])
-
-        values = converter(None)
-        self.assertEqual(values, [])
-
-        values = converter('')
-        self.assertEqual(values, [''])
-
-        values = converter('   ,    ,,      ')
-        self.assertEqual(values, ['   ', '    ', '', '      '])
+    def test_strip_blank_matrix(self):
+        """ Comma delimiters, all strip/blank combinations, no converter """
+        for (strip, allow_blank), value, expected in self.MATRIX:
+            converter = self.converters[(strip, allow_blank)]
+            with self.subTest(
+                strip=strip, allow_blank=allow_blank, value=value
+            ):
+                self.assertEqual(converter(value), expected)
 
 if __name__ == '__main__':
     unittest.main()